@@ -0,0 +1,122 @@
+"""
+File: benchmarks/bench_fetch.py
+
+Project: DataFun-03-Analytics
+
+Description:
+    Benchmark the get_* fetchers offline against benchmarks/mock_http_server.py.
+
+    1. Cold fetch: download every file in FETCH_JOBS (times --copies) into an empty
+       temporary folder with fetch_all() at each worker count, and report wall time,
+       throughput and speedup over one worker.
+    2. Revalidation: fetch the same files again with the manifest in place, so every
+       request is conditional and answered with 304 Not Modified.
+
+    Server latency, bandwidth, chunked encoding and error injection are configurable,
+    so the effect of concurrency can be seen under realistic network conditions.
+    Nothing is written to data/.
+
+Usage:
+    python benchmarks/bench_fetch.py
+    python benchmarks/bench_fetch.py --latency 0.1 --bandwidth 500000 --workers 1 2 4 8 16 --copies 8
+    python benchmarks/bench_fetch.py --chunked --error-rate 0.1
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+
+# Ensure project root is in sys.path for local imports
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+
+# Import local modules
+from mock_http_server import MockServerConfig, mock_http_server
+from michaeljmoore_run_all import FETCH_JOBS
+from utils_fetch import FetchJob, fetch_all
+from utils_logger import logger
+
+#####################################
+# Define Functions
+#####################################
+
+def make_jobs(server, folder: pathlib.Path, copies: int) -> list[FetchJob]:
+    """Point every registered fetch job at the mock server, `copies` times each."""
+    return [
+        job._replace(folder_name=str(folder), filename=f"copy{copy}_{job.filename}", url=server.url(job.filename))
+        for copy in range(copies)
+        for job in FETCH_JOBS
+    ]
+
+def timed_fetch_all(jobs: list[FetchJob], workers: int) -> float:
+    """Run fetch_all and return the wall-clock time in seconds."""
+    start = time.perf_counter()
+    fetch_all(jobs, max_workers=workers)
+    return time.perf_counter() - start
+
+def run_benchmark(config: MockServerConfig, workers: list[int], copies: int, repeat: int) -> None:
+    """Measure cold fetches at each worker count, then a revalidation pass, and print the results."""
+    logger.remove()  # The fetchers log every request; keep the report readable
+
+    with mock_http_server(config) as server:
+        print(f"Mock server: latency {config.latency}s, bandwidth {config.bandwidth or 'unlimited'} B/s, "
+              f"chunked {config.chunked}, error rate {config.error_rate:.0%}")
+        print(f"{'workers':>7} {'files':>6} {'MB':>7} {'seconds':>9} {'MB/s':>8} {'speedup':>8} {'errors':>7}")
+
+        baseline = None
+        for worker_count in workers:
+            best = None
+            for _ in range(repeat):
+                with tempfile.TemporaryDirectory() as folder:
+                    jobs = make_jobs(server, pathlib.Path(folder), copies)
+                    errors_before = server.stats["errors"]
+                    seconds = timed_fetch_all(jobs, worker_count)
+                    errors = server.stats["errors"] - errors_before
+                    size_mb = sum(path.stat().st_size for path in pathlib.Path(folder).glob("copy*")) / 1e6
+                if best is None or seconds < best[0]:
+                    best = (seconds, size_mb, errors)
+            seconds, size_mb, errors = best
+            baseline = baseline or seconds
+            print(f"{worker_count:>7} {len(jobs):>6} {size_mb:7.2f} {seconds:9.3f} {size_mb / seconds:8.2f} "
+                  f"{baseline / seconds:7.2f}x {errors:>7}")
+
+        # Second pass over the same folder: every request carries validators from the manifest
+        with tempfile.TemporaryDirectory() as folder:
+            jobs = make_jobs(server, pathlib.Path(folder), copies)
+            fetch_all(jobs, max_workers=max(workers))
+            not_modified_before = server.stats["not_modified"]
+            seconds = timed_fetch_all(jobs, max(workers))
+            not_modified = server.stats["not_modified"] - not_modified_before
+        print(f"Revalidation with {max(workers)} workers: {len(jobs)} files in {seconds:.3f}s, "
+              f"{not_modified} answered 304 Not Modified")
+        print(f"Server totals: {dict(server.stats)}")
+
+#####################################
+# Main Execution
+#####################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the get_* fetchers against a local mock server.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="worker counts to compare")
+    parser.add_argument("--copies", type=int, default=2, help="times each data file is downloaded per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per worker count (best is reported)")
+    parser.add_argument("--latency", type=float, default=0.05, help="server delay before each response, in seconds")
+    parser.add_argument("--bandwidth", type=float, default=2_000_000, help="bytes per second per response (0 = unlimited)")
+    parser.add_argument("--chunked", action="store_true", help="use chunked transfer encoding")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests to fail with 503")
+    args = parser.parse_args()
+
+    server_config = MockServerConfig(
+        latency=args.latency,
+        bandwidth=args.bandwidth or None,
+        chunked=args.chunked,
+        error_rate=args.error_rate,
+        seed=42,
+    )
+    run_benchmark(server_config, args.workers, args.copies, args.repeat)
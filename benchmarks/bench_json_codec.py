@@ -0,0 +1,106 @@
+"""
+File: benchmarks/bench_json_codec.py
+
+Project: DataFun-03-Analytics
+
+Description:
+    Benchmark the JSON backends available to utils_json (orjson, simdjson, stdlib json)
+    on a large zodiac-style document, and report the speedup of each one over the
+    standard library for parsing (load) and serializing (dump). Dumps are compact,
+    because indented output always comes from the standard library.
+
+Usage:
+    python benchmarks/bench_json_codec.py
+    python benchmarks/bench_json_codec.py --signs 50000 --repeat 5
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import argparse
+import pathlib
+import random
+import sys
+import time
+
+# Ensure project root is in sys.path for local imports
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+
+# Import local modules
+import utils_json
+
+#####################################
+# Define Functions
+#####################################
+
+def make_zodiac_document(signs: int, people_per_sign: int = 10, seed: int = 42) -> dict:
+    """Build a document with the same shape as data/zodiac.json, scaled to `signs` entries."""
+    rng = random.Random(seed)
+    words = ["bold", "curious", "loyal", "ambitious", "gentle", "restless", "witty", "calm", "fiery", "patient"]
+    elements = ["Fire", "Earth", "Air", "Water"]
+    planets = ["Mars", "Venus", "Mercury", "Moon", "Sun", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
+
+    def sentence(length: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(length)).capitalize() + "."
+
+    return {
+        "zodiacSigns": [
+            {
+                "name": f"Sign {index}",
+                "element": rng.choice(elements),
+                "stone": "Diamond",
+                "planet": rng.choice(planets),
+                "summary": " ".join(sentence(12) for _ in range(5)),
+                "qualities": [rng.choice(words).capitalize() for _ in range(3)],
+                "defaults": [rng.choice(words).capitalize() for _ in range(3)],
+                "famousPeople": [
+                    {"name": f"Person {index}-{person}", "birthday": f"March {rng.randint(1, 31)}"}
+                    for person in range(people_per_sign)
+                ],
+            }
+            for index in range(signs)
+        ]
+    }
+
+def best_time(function, repeat: int) -> float:
+    """Return the fastest of `repeat` timed calls, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def run_benchmark(signs: int, repeat: int) -> None:
+    """Time load and dump for every installed backend and print a comparison table."""
+    document = make_zodiac_document(signs)
+    utils_json.select_backend("json")
+    encoded = utils_json.dumps(document, indent=4)
+    size_mb = len(encoded) / 1_000_000
+    print(f"Document: {signs} signs, {size_mb:.1f} MB, best of {repeat} runs")
+    print(f"{'backend':<10} {'load s':>9} {'load MB/s':>10} {'speedup':>8} {'dump s':>9} {'speedup':>8}")
+
+    baseline = None
+    for backend in reversed(utils_json.available_backends()):  # stdlib json first
+        utils_json.select_backend(backend)
+        load_time = best_time(lambda: utils_json.loads(encoded), repeat)
+        dump_time = best_time(lambda: utils_json.dumps(document), repeat)
+        if baseline is None:
+            baseline = (load_time, dump_time)
+        print(f"{backend:<10} {load_time:9.4f} {size_mb / load_time:10.1f} {baseline[0] / load_time:7.1f}x "
+              f"{dump_time:9.4f} {baseline[1] / dump_time:7.1f}x")
+
+    utils_json.select_backend()
+
+#####################################
+# Main Execution
+#####################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the JSON backends used by utils_json.")
+    parser.add_argument("--signs", type=int, default=20000, help="number of zodiac entries to generate")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement (best is reported)")
+    args = parser.parse_args()
+    run_benchmark(args.signs, args.repeat)
@@ -0,0 +1,340 @@
+"""
+File: benchmarks/bench_processors.py
+
+Project: DataFun-03-Analytics
+
+Description:
+    Benchmark the core processors on large synthetic datasets:
+
+        csv    analyze_running_time()        Disney-schema CSV
+        excel  count_word_in_column()        Powerball-schema workbook (openpyxl, no cache)
+        excel_cached  count_word_in_column() same workbook, column cache already built
+        json   famous_people_by_zodiac()     zodiac-schema JSON
+        text   count_word_occurrences()      script-like text
+        terms  count_terms()                 same text, every tracked term in one pass
+        terms_per_term  count_word_occurrences()
+                                             same text, once per tracked term
+
+    When both term benchmarks run, count_terms() must be faster than counting the
+    terms one at a time, or the run is reported as a regression.
+
+    Peak RSS is the high-water mark of the whole process; RSS growth is how much
+    it rose during the timed call alone.
+
+    Each dataset is generated once at the requested size and kept in benchmarks/.data/
+    for later runs. Every measurement runs in a fresh Python process, so peak RSS
+    (resource.ru_maxrss) reflects only that processor, and caches from earlier runs
+    in the same process cannot skew the timing.
+
+    Results (seconds, MB/s, peak RSS) can be saved as baselines in
+    benchmarks/baselines.json and compared against later runs. The script exits with
+    code 1 when a benchmark is slower than its baseline by more than the tolerance.
+
+    Writing xlsx files is slow (roughly 15k rows per second, about 24 bytes per row),
+    so large Excel sizes take minutes to generate the first time.
+
+Usage:
+    python benchmarks/bench_processors.py                         # 10 MB of each format
+    python benchmarks/bench_processors.py --size-mb 100 1000 --benchmarks csv text
+    python benchmarks/bench_processors.py --save-baseline         # record the current results
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import argparse
+import csv
+import datetime
+import json
+import pathlib
+import platform
+import random
+import subprocess
+import sys
+import time
+
+# Ensure project root is in sys.path for local imports
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.append(str(PROJECT_ROOT))
+
+#####################################
+# Declare Global Variables
+#####################################
+
+BENCHMARK_DIR = pathlib.Path(__file__).resolve().parent
+DATASET_DIR = BENCHMARK_DIR.joinpath(".data")
+BASELINE_FILE = BENCHMARK_DIR.joinpath("baselines.json")
+
+# Benchmark name -> dataset format
+BENCHMARKS: dict[str, str] = {
+    "csv": "csv",
+    "excel": "xlsx",
+    "excel_cached": "xlsx",
+    "json": "json",
+    "text": "txt",
+    "terms": "txt",
+    "terms_per_term": "txt",
+}
+
+# Allowed slowdown against the baseline before a result is reported as a regression
+DEFAULT_TOLERANCE: float = 0.20
+
+# Same header as data/DisneyMovies_cleaned_data.csv
+DISNEY_HEADER: list[str] = [
+    "", "title", "Production company", "Release date", "Running time", "Country", "Language",
+    "Box office", "Budget", "Directed by", "Produced by", "Written by", "Based on", "Starring",
+    "Music by", "Distributed by", "Story by", "Narrated by", "Cinematography", "Edited by",
+    "Screenplay by", "Production companies", "Japanese", "Hepburn", "Adaptation by",
+    "Traditional", "Simplified",
+]
+
+WORDS: list[str] = [
+    "the", "chocolate", "golden", "ticket", "factory", "river", "candy", "boy", "grandpa",
+    "room", "everlasting", "gobstopper", "oompa", "loompa", "wonderful", "strange", "little",
+    "pure", "imagination", "come", "with", "me", "and", "you'll", "be", "in", "a", "world",
+]
+SPEAKERS: list[str] = ["WONKA", "CHARLIE", "GRANDPA JOE", "VERUCA", "MIKE", "VIOLET", "AUGUSTUS"]
+
+#####################################
+# Dataset Generators
+#####################################
+
+def generate_csv(path: pathlib.Path, size_bytes: int, seed: int = 42) -> None:
+    """Write a Disney-schema CSV of about size_bytes, with ~2% blank Running time values."""
+    rng = random.Random(seed)
+    with path.open('w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(DISNEY_HEADER)
+        index = 0
+        while file.tell() < size_bytes:
+            for _ in range(1000):
+                running_time = "" if rng.random() < 0.02 else f"{rng.randint(40, 180)}.0"
+                writer.writerow([
+                    index, f"Movie {index}", "Walt Disney Productions", "1990-01-01", running_time,
+                    "United States", "English", f"{rng.uniform(1e5, 1e9):.1f}", f"{rng.uniform(1e5, 3e8):.1f}",
+                    "['Director One', 'Director Two']", "Producer", "", "", "['Star One', 'Star Two']",
+                ] + [""] * 13)
+                index += 1
+
+def generate_xlsx(path: pathlib.Path, size_bytes: int, seed: int = 42) -> None:
+    """Write a Powerball-schema workbook of about size_bytes (estimated at ~24 bytes per row)."""
+    import openpyxl
+
+    rng = random.Random(seed)
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(["Draw Date", "Winning Numbers", "Multiplier"])
+    first_draw = datetime.datetime(2010, 2, 3)
+    for index in range(max(1, size_bytes // 24)):
+        numbers = sorted(rng.sample(range(1, 70), 5)) + [rng.randint(1, 26)]
+        sheet.append([
+            first_draw + datetime.timedelta(days=index % 2_500_000),
+            " ".join(f"{number:02d}" for number in numbers),
+            rng.choice([2, 3, 4, 5, 10]),
+        ])
+    workbook.save(path)
+
+def generate_json(path: pathlib.Path, size_bytes: int, seed: int = 42) -> None:
+    """Write a zodiac-schema JSON document of about size_bytes, one sign at a time."""
+    rng = random.Random(seed)
+    with path.open('w', encoding='utf-8') as file:
+        file.write('{\n    "zodiacSigns": [\n')
+        index = 0
+        while True:
+            sign = {
+                "name": f"Sign {index}",
+                "element": rng.choice(["Fire", "Earth", "Air", "Water"]),
+                "summary": " ".join(rng.choices(WORDS, k=40)),
+                "famousPeople": [
+                    {"name": f"Person {index}-{person}", "birthday": f"March {rng.randint(1, 31)}"}
+                    for person in range(rng.randint(5, 15))
+                ],
+            }
+            file.write(json.dumps(sign, indent=4))
+            index += 1
+            if file.tell() >= size_bytes:
+                break
+            file.write(",\n")
+        file.write("\n    ]\n}\n")
+
+def generate_text(path: pathlib.Path, size_bytes: int, seed: int = 42) -> None:
+    """Write a script-like text file of about size_bytes with speaker lines and stage directions."""
+    rng = random.Random(seed)
+    with path.open('w', encoding='utf-8') as file:
+        while file.tell() < size_bytes:
+            lines = []
+            for _ in range(1000):
+                if rng.random() < 0.1:
+                    lines.append(f"({' '.join(rng.choices(WORDS, k=8))}, Wonka watches)\n\n")
+                else:
+                    lines.append(f"{rng.choice(SPEAKERS)}: {' '.join(rng.choices(WORDS, k=12)).capitalize()}!\n\n")
+            file.write("".join(lines))
+
+GENERATORS = {"csv": generate_csv, "xlsx": generate_xlsx, "json": generate_json, "txt": generate_text}
+
+def ensure_dataset(file_format: str, size_mb: float) -> pathlib.Path:
+    """Return the path of a generated dataset, generating it if it does not exist yet."""
+    DATASET_DIR.mkdir(parents=True, exist_ok=True)
+    path = DATASET_DIR.joinpath(f"synthetic_{size_mb:g}mb.{file_format}")
+    if not path.exists():
+        print(f"Generating {path.name}...", flush=True)
+        start = time.perf_counter()
+        temp_path = path.with_name(path.name + ".tmp")
+        GENERATORS[file_format](temp_path, int(size_mb * 1_000_000))
+        temp_path.replace(path)
+        print(f"Generated {path.name} ({path.stat().st_size / 1e6:.1f} MB) in {time.perf_counter() - start:.1f}s")
+    return path
+
+#####################################
+# Measurement (runs in a fresh process)
+#####################################
+
+def run_worker(name: str, path: pathlib.Path) -> dict:
+    """Import the processor, time one call and return timing and memory figures."""
+    import resource
+
+    from utils_logger import logger
+    logger.remove()  # Keep log I/O out of the measurement
+
+    if name == "csv":
+        from michaeljmoore_process_csv import analyze_running_time
+        call = lambda: analyze_running_time(path)
+    elif name in ("excel", "excel_cached"):
+        from michaeljmoore_process_excel import count_word_in_column
+        use_cache = name == "excel_cached"
+        if use_cache:
+            from utils_excel_cache import ensure_cache
+            ensure_cache(path)  # Build outside the timed call
+        call = lambda: count_word_in_column(path, "B", "12", use_cache=use_cache)
+    elif name == "json":
+        from michaeljmoore_process_json import famous_people_by_zodiac
+        call = lambda: famous_people_by_zodiac(path)
+    elif name == "text":
+        from michaeljmoore_process_text import count_word_occurrences
+        call = lambda: count_word_occurrences(path, "Wonka")
+    elif name == "terms":
+        from michaeljmoore_process_text import TRACKED_TERMS, count_terms
+        call = lambda: count_terms(path, TRACKED_TERMS, whole_word=True)
+    elif name == "terms_per_term":
+        from michaeljmoore_process_text import TRACKED_TERMS, count_word_occurrences
+        call = lambda: [count_word_occurrences(path, term) for term in TRACKED_TERMS]
+    else:
+        raise ValueError(f"Unknown benchmark: {name}")
+
+    rss_before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    call()
+    seconds = time.perf_counter() - start
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # KiB on Linux
+    return {
+        "seconds": seconds,
+        "peak_rss_mb": peak_rss_kb / 1024,
+        "rss_growth_mb": (peak_rss_kb - rss_before_kb) / 1024,
+    }
+
+def measure(name: str, path: pathlib.Path, repeat: int) -> dict:
+    """Run a benchmark `repeat` times, each in a new interpreter, and keep the fastest run."""
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, __file__, "--worker", name, str(path)],
+            cwd=DATASET_DIR,  # Logs and caches land next to the datasets, not in the project
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Benchmark {name} failed:\n{result.stderr[-2000:]}")
+        runs.append(json.loads(result.stdout.splitlines()[-1]))
+    best = min(runs, key=lambda run: run["seconds"])
+    size_mb = path.stat().st_size / 1e6
+    return {
+        "size_mb": round(size_mb, 2),
+        "seconds": round(best["seconds"], 4),
+        "mb_per_s": round(size_mb / best["seconds"], 2),
+        "peak_rss_mb": round(max(run["peak_rss_mb"] for run in runs), 1),
+        "rss_growth_mb": round(max(run["rss_growth_mb"] for run in runs), 1),
+    }
+
+#####################################
+# Baselines
+#####################################
+
+def load_baselines() -> dict:
+    """Read stored baselines, or return an empty dict if there are none."""
+    try:
+        with BASELINE_FILE.open('r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+def save_baselines(results: dict[str, dict]) -> None:
+    """Merge results into the baseline file."""
+    baselines = load_baselines()
+    stamp = {"python": platform.python_version(), "machine": platform.machine(), "date": datetime.date.today().isoformat()}
+    for key, result in results.items():
+        baselines[key] = {**result, **stamp}
+    with BASELINE_FILE.open('w', encoding='utf-8') as file:
+        json.dump(baselines, file, indent=4, sort_keys=True)
+    print(f"Saved {len(results)} baselines to {BASELINE_FILE}")
+
+def run_benchmarks(names: list[str], sizes: list[float], repeat: int, tolerance: float, save: bool) -> bool:
+    """Run every benchmark at every size, print a report and return False on any regression."""
+    baselines = load_baselines()
+    results: dict[str, dict] = {}
+    regressions = 0
+    print(f"{'benchmark':<22} {'MB':>8} {'seconds':>9} {'MB/s':>8} {'peak RSS':>9} {'RSS growth':>10} {'vs baseline':>12}")
+    for size_mb in sizes:
+        for name in names:
+            path = ensure_dataset(BENCHMARKS[name], size_mb)
+            key = f"{name}@{size_mb:g}MB"
+            result = results[key] = measure(name, path, repeat)
+
+            comparison = "-"
+            baseline = baselines.get(key)
+            if baseline:
+                change = result["seconds"] / baseline["seconds"] - 1
+                comparison = f"{change:+.0%}"
+                if change > tolerance:
+                    comparison += " SLOWER"
+                    regressions += 1
+            print(f"{key:<22} {result['size_mb']:8.1f} {result['seconds']:9.3f} {result['mb_per_s']:8.1f} "
+                  f"{result['peak_rss_mb']:8.1f}M {result['rss_growth_mb']:9.1f}M {comparison:>12}")
+
+        # One pass over many terms must beat one pass per term
+        single_pass = results.get(f"terms@{size_mb:g}MB")
+        per_term = results.get(f"terms_per_term@{size_mb:g}MB")
+        if single_pass and per_term:
+            speedup = per_term["seconds"] / single_pass["seconds"]
+            print(f"count_terms vs per-term counting @{size_mb:g}MB: {speedup:.2f}x"
+                  f"{'' if speedup > 1 else ' SLOWER'}")
+            if speedup <= 1:
+                regressions += 1
+
+    if save:
+        save_baselines(results)
+    elif regressions:
+        print(f"{regressions} benchmark(s) slower than baseline by more than {tolerance:.0%}")
+    return save or regressions == 0
+
+#####################################
+# Main Execution
+#####################################
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--worker":
+        print(json.dumps(run_worker(sys.argv[2], pathlib.Path(sys.argv[3]))))
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Benchmark the processors on large synthetic datasets.")
+    parser.add_argument("--size-mb", type=float, nargs="+", default=[10], help="dataset sizes to generate and measure")
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS),
+                        help="benchmarks to run")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh-process runs per benchmark (fastest is reported)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown against the baseline, e.g. 0.2 for 20%%")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baselines")
+    args = parser.parse_args()
+    ok = run_benchmarks(args.benchmarks, args.size_mb, args.repeat, args.tolerance, args.save_baseline)
+    sys.exit(0 if ok else 1)
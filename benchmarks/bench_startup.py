@@ -0,0 +1,116 @@
+"""
+File: benchmarks/bench_startup.py
+
+Project: DataFun-03-Analytics
+
+Description:
+    Measure the import (startup) time of the pipeline scripts with `python -X importtime`
+    and check it against a budget. Each import runs in a fresh interpreter, so nothing
+    is cached between measurements.
+
+    The check fails (exit code 1) when a module takes longer than the budget to import,
+    or when it pulls in one of the heavy packages that are meant to load lazily
+    (requests, openpyxl, pandas, numpy).
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --budget-ms 100 --repeat 7
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import argparse
+import pathlib
+import subprocess
+import sys
+
+#####################################
+# Declare Global Variables
+#####################################
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+# Modules measured by default; run_all imports every other script
+MODULES: list[str] = [
+    "michaeljmoore_run_all",
+    "michaeljmoore_get_csv",
+    "michaeljmoore_process_csv",
+    "michaeljmoore_process_excel",
+    "michaeljmoore_process_json",
+    "michaeljmoore_process_text",
+]
+
+# Packages that must only be imported by the functions that use them
+LAZY_PACKAGES: tuple[str, ...] = ("requests", "openpyxl", "pandas", "numpy")
+
+# Import-time budget per module, in milliseconds (about twice the measured time)
+DEFAULT_BUDGET_MS: float = 150.0
+
+#####################################
+# Define Functions
+#####################################
+
+def measure_import(module: str) -> tuple[float, set[str]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        tuple[float, set[str]]: Cumulative import time of the module in milliseconds,
+        and the names of every module imported along the way.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed_us = 0
+    imported = set()
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        imported.add(name)
+        if name == module:
+            elapsed_us = int(cumulative)
+    return elapsed_us / 1000, imported
+
+def run_benchmark(modules: list[str], budget_ms: float, repeat: int) -> bool:
+    """Measure every module, print a report and return True when all are within budget."""
+    print(f"Import time budget: {budget_ms:.0f} ms per module, best of {repeat} runs")
+    print(f"{'module':<30} {'ms':>8}  status")
+    all_ok = True
+    for module in modules:
+        timings = []
+        for _ in range(repeat):
+            elapsed_ms, imported = measure_import(module)
+            timings.append(elapsed_ms)
+        best = min(timings)
+        eager = sorted(package for package in LAZY_PACKAGES if package in imported)
+
+        problems = []
+        if best > budget_ms:
+            problems.append("over budget")
+        if eager:
+            problems.append(f"imports {', '.join(eager)} eagerly")
+        all_ok = all_ok and not problems
+        print(f"{module:<30} {best:8.1f}  {'; '.join(problems) or 'ok'}")
+    return all_ok
+
+#####################################
+# Main Execution
+#####################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the import time of the pipeline scripts.")
+    parser.add_argument("modules", nargs="*", default=MODULES, help="modules to measure")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="maximum import time per module")
+    parser.add_argument("--repeat", type=int, default=5, help="imports per module (best is reported)")
+    args = parser.parse_args()
+    sys.exit(0 if run_benchmark(args.modules, args.budget_ms, args.repeat) else 1)
@@ -0,0 +1,257 @@
+"""
+File: benchmarks/mock_http_server.py
+
+Project: DataFun-03-Analytics
+
+Description:
+    A local stand-in for the GitHub raw-file URLs used by the get_* scripts, so fetching
+    can be exercised and benchmarked offline. It serves the files of a folder (data/ by
+    default) over HTTP/1.1 from a thread per connection, with configurable behavior:
+
+    - latency: delay before each response starts, to mimic a network round-trip
+    - bandwidth: per-response transfer rate in bytes per second
+    - chunked: send bodies with Transfer-Encoding: chunked instead of Content-Length
+    - etag: send ETag and Last-Modified headers and answer conditional requests
+      (If-None-Match / If-Modified-Since) with 304 Not Modified
+    - error_rate / error_status: answer a random fraction of requests with an error
+
+    The server also counts requests, 304 responses, injected errors and bytes sent.
+
+    Use it as a context manager (e.g. in a benchmark or an ad-hoc test):
+
+        with mock_http_server(MockServerConfig(latency=0.05)) as server:
+            fetch_csv_file(temp_dir, CSV_FILENAME, server.url(CSV_FILENAME))
+
+Usage:
+    python benchmarks/mock_http_server.py --port 8765 --latency 0.05 --bandwidth 1000000
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import argparse
+import contextlib
+import email.utils
+import hashlib
+import pathlib
+import random
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, NamedTuple
+
+#####################################
+# Declare Global Variables
+#####################################
+
+DATA_DIR = pathlib.Path(__file__).resolve().parent.parent.joinpath("data")
+
+#####################################
+# Define Classes
+#####################################
+
+class MockServerConfig(NamedTuple):
+    """Behavior of the mock server. The defaults serve files as fast as possible."""
+    latency: float = 0.0  # Seconds to wait before each response
+    bandwidth: float | None = None  # Bytes per second per response, or None for unlimited
+    chunked: bool = False  # Use Transfer-Encoding: chunked
+    etag: bool = True  # Send validators and honor conditional requests
+    error_rate: float = 0.0  # Fraction of requests answered with error_status
+    error_status: int = 503
+    chunk_size: int = 16 * 1024  # Bytes written per socket write (and per chunk)
+    seed: int | None = None  # Seed for error injection, for reproducible runs
+
+class MockHTTPServer(ThreadingHTTPServer):
+    """HTTP server that serves the files in `root` according to a MockServerConfig."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], root: pathlib.Path, config: MockServerConfig) -> None:
+        super().__init__(address, MockRequestHandler)
+        self.root = root.resolve()
+        self.config = config
+        self.stats: Counter = Counter()
+        self._lock = threading.Lock()
+        self._rng = random.Random(config.seed)
+        self._etags: dict[tuple[str, int], str] = {}
+
+    def url(self, filename: str) -> str:
+        """Return the URL that serves a file from the root folder."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/{urllib.parse.quote(filename)}"
+
+    def count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def should_fail(self) -> bool:
+        """Decide whether to inject an error into the current request."""
+        with self._lock:
+            return self._rng.random() < self.config.error_rate
+
+    def etag_for(self, path: pathlib.Path) -> str:
+        """Return a strong ETag for a file, cached per (path, mtime)."""
+        key = (str(path), path.stat().st_mtime_ns)
+        with self._lock:
+            if key not in self._etags:
+                self._etags[key] = '"' + hashlib.sha256(path.read_bytes()).hexdigest()[:32] + '"'
+            return self._etags[key]
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """Serve GET requests for files in the server's root folder."""
+
+    protocol_version = "HTTP/1.1"
+    server: MockHTTPServer
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # Keep benchmark output clean
+
+    def do_GET(self) -> None:
+        config = self.server.config
+        self.server.count("requests")
+        if config.latency:
+            time.sleep(config.latency)
+
+        if self.server.should_fail():
+            self.server.count("errors")
+            self.send_error(config.error_status)
+            return
+
+        path = self._resolve(self.path)
+        if path is None:
+            self.server.count("not_found")
+            self.send_error(404)
+            return
+
+        stat = path.stat()
+        last_modified = email.utils.formatdate(stat.st_mtime, usegmt=True)
+        etag = self.server.etag_for(path) if config.etag else None
+        if config.etag and self._not_modified(etag, stat.st_mtime):
+            self.server.count("not_modified")
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+        if config.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        else:
+            self.send_header("Content-Length", str(stat.st_size))
+        self.end_headers()
+        self._send_body(path)
+
+    def _resolve(self, request_path: str) -> pathlib.Path | None:
+        """Map a request path to a file inside the root folder, or None."""
+        name = urllib.parse.unquote(urllib.parse.urlsplit(request_path).path).lstrip("/")
+        path = self.server.root.joinpath(name).resolve()
+        if path.parent != self.server.root or not path.is_file():
+            return None
+        return path
+
+    def _not_modified(self, etag: str, mtime: float) -> bool:
+        """Evaluate If-None-Match (preferred) or If-Modified-Since."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            return etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                return int(mtime) <= email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _send_body(self, path: pathlib.Path) -> None:
+        """Stream the file, pacing writes to the configured bandwidth."""
+        config = self.server.config
+        start = time.perf_counter()
+        sent = 0
+        with path.open('rb') as file:
+            for chunk in iter(lambda: file.read(config.chunk_size), b""):
+                if config.chunked:
+                    self.wfile.write(f"{len(chunk):X}\r\n".encode('ascii') + chunk + b"\r\n")
+                else:
+                    self.wfile.write(chunk)
+                sent += len(chunk)
+                if config.bandwidth:
+                    delay = sent / config.bandwidth - (time.perf_counter() - start)
+                    if delay > 0:
+                        time.sleep(delay)
+        if config.chunked:
+            self.wfile.write(b"0\r\n\r\n")
+        self.server.count("bytes_sent", sent)
+
+#####################################
+# Define Functions
+#####################################
+
+@contextlib.contextmanager
+def mock_http_server(
+    config: MockServerConfig = MockServerConfig(),
+    root: pathlib.Path = DATA_DIR,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> Iterator[MockHTTPServer]:
+    """
+    Run a MockHTTPServer on a background thread for the duration of a with block.
+
+    Args:
+        config (MockServerConfig): Latency, bandwidth, encoding and error settings.
+        root (pathlib.Path): Folder whose files are served.
+        host (str): Interface to bind.
+        port (int): Port to bind, or 0 for any free port.
+
+    Yields:
+        MockHTTPServer: The running server; use server.url(filename) to build URLs.
+    """
+    server = MockHTTPServer((host, port), root, config)
+    thread = threading.Thread(target=server.serve_forever, name="mock-http-server", daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+#####################################
+# Main Execution
+#####################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve data files with simulated network conditions.")
+    parser.add_argument("--root", type=pathlib.Path, default=DATA_DIR, help="folder to serve")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before each response")
+    parser.add_argument("--bandwidth", type=float, default=None, help="bytes per second per response")
+    parser.add_argument("--chunked", action="store_true", help="use chunked transfer encoding")
+    parser.add_argument("--no-etag", action="store_true", help="do not send validators or answer 304")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests to fail")
+    parser.add_argument("--error-status", type=int, default=503, help="status code for injected errors")
+    args = parser.parse_args()
+
+    config = MockServerConfig(
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+        chunked=args.chunked,
+        etag=not args.no_etag,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+    )
+    with mock_http_server(config, root=args.root, port=args.port) as server:
+        print(f"Serving {server.root} at {server.url('')} (Ctrl+C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        print(f"Stats: {dict(server.stats)}")
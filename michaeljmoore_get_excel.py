@@ -23,77 +23,81 @@ Date: 2025-09-12
 # Import from Python Standard Library
 import pathlib
 import sys
-
-# Import from external packages
-import requests
+from typing import Iterable
 
 # Ensure project root is in sys.path for local imports
 sys.path.append(str(pathlib.Path(__file__).resolve().parent))
 
 # Import local modules
 from utils_logger import logger
+from utils_fetch import as_chunks, download_file, write_chunks_atomically
 
 #####################################
 # Declare Global Variables
 #####################################
 
 FETCHED_DATA_DIR = "data"
+EXCEL_FILENAME = "Lottery_Powerball_Winning_Numbers__Beginning_2010.xlsx"
+EXCEL_URL = 'https://github.com/waldomac00/hosted_data/raw/refs/heads/main/Lottery_Powerball_Winning_Numbers__Beginning_2010.xlsx'
 
 #####################################
 # Define Functions
 #####################################
 
-def fetch_excel_file(folder_name: str, filename: str, url: str) -> None:
+def fetch_excel_file(folder_name: str, filename: str, url: str) -> bool:
     """
     Fetch Excel data from the given URL and write it to a file.
 
+    If the file was fetched before, the request carries the ETag and Last-Modified
+    values from the fetch manifest, and nothing is written when the server answers
+    304 Not Modified or returns content identical to the local copy.
+
+    The body is streamed to disk in chunks and never held in memory as a whole.
+
     Args:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
         url (str): URL of the Excel file to fetch.
 
     Returns:
-        None
+        bool: True when the local file is up to date, False if the fetch failed.
 
     Example:
         fetch_excel_file("data", "data.xlsx", "https://example.com/data.xlsx")
     """
-    if not url:
-        logger.error("The URL provided is empty. Please provide a valid URL.")
-        return
-
-    try:
-        logger.info(f"Fetching Excel data from {url}...")
-        response = requests.get(url)
-        response.raise_for_status()
-        write_excel_file(folder_name, filename, response.content)
-        logger.info(f"SUCCESS: Excel file fetched and saved as {filename}")
-    except requests.exceptions.HTTPError as http_err:
-        logger.error(f"HTTP error occurred: {http_err}")
-    except requests.exceptions.RequestException as req_err:
-        logger.error(f"Request error occurred: {req_err}")
-
-def write_excel_file(folder_name: str, filename: str, binary_data: bytes) -> None:
+    return download_file(folder_name, filename, url, write_excel_file, "Excel")
+
+def write_excel_file(
+    folder_name: str,
+    filename: str,
+    binary_data: bytes | Iterable[bytes],
+    unchanged_sha256: str | None = None,
+) -> str | None:
     """
-    Write Excel binary data to a file.
+    Write Excel data to a file.
+
+    The data is streamed through a temporary file that is atomically renamed
+    into place, so a failed or interrupted write never leaves a partial file.
 
     Args:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
-        binary_data (bytes): Binary content of the Excel file.
+        binary_data (bytes | Iterable[bytes]): Binary content of the Excel file, or an iterable of byte chunks.
+        unchanged_sha256 (str | None): Hash of the current local file; when the new
+            content matches it, the existing file is left untouched.
 
     Returns:
-        None
+        str | None: SHA-256 hex digest of the content, or None if the write failed.
     """
     file_path = pathlib.Path(folder_name).joinpath(filename)
     try:
         logger.info(f"Writing Excel data to {file_path}...")
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open('wb') as file:
-            file.write(binary_data)
+        sha256 = write_chunks_atomically(file_path, as_chunks(binary_data), unchanged_sha256)
         logger.info(f"SUCCESS: Excel data written to {file_path}")
+        return sha256
     except IOError as io_err:
         logger.error(f"Error writing Excel data to {file_path}: {io_err}")
+        return None
 
 #####################################
 # Define main() function
@@ -103,9 +107,8 @@ def main():
     """
     Main function to demonstrate fetching Excel data.
     """
-    excel_url = 'https://github.com/waldomac00/hosted_data/raw/refs/heads/main/Lottery_Powerball_Winning_Numbers__Beginning_2010.xlsx'
     logger.info("Starting Excel fetch demonstration...")
-    fetch_excel_file(FETCHED_DATA_DIR, "Lottery_Powerball_Winning_Numbers__Beginning_2010.xlsx", excel_url)
+    fetch_excel_file(FETCHED_DATA_DIR, EXCEL_FILENAME, EXCEL_URL)
 
 #####################################
 # Conditional Execution
@@ -21,80 +21,97 @@ Date: 2025-09-12
 #####################################
 
 # Import from Python Standard Library
-import json
 import pathlib
 import sys
-
-# Import from external packages
-import requests
+from typing import Iterable
 
 # Ensure project root is in sys.path for local imports
 sys.path.append(str(pathlib.Path(__file__).resolve().parent))
 
 # Import local modules
 from utils_logger import logger
+import utils_json
+from utils_fetch import as_chunks, download_file, write_chunks_atomically
 
 #####################################
 # Declare Global Variables
 #####################################
 
 FETCHED_DATA_DIR = "data"
+JSON_FILENAME = "zodiac.json"
+JSON_URL = 'https://raw.githubusercontent.com/claireszt/zodiac-json/refs/heads/main/zodiac.json'
 
 #####################################
 # Define Functions
 #####################################
 
-def fetch_json_file(folder_name: str, filename: str, url: str) -> None:
+def fetch_json_file(folder_name: str, filename: str, url: str, raw: bool = True) -> bool:
     """
     Fetch JSON data from the given URL and write it to a file.
 
+    If the file was fetched before, the request carries the ETag and Last-Modified
+    values from the fetch manifest, and nothing is written when the server answers
+    304 Not Modified or returns content identical to the local copy.
+
+    In raw mode (the default) the response bytes are streamed straight to disk
+    without being parsed, so fetching costs I/O only. The document is validated
+    later, when it is read by process_json_file(). With raw=False the
+    response is parsed and re-serialized with indentation.
+
     Args:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
         url (str): URL of the JSON file to fetch.
+        raw (bool): Write the upstream bytes as-is instead of parsing them.
 
     Returns:
-        None
+        bool: True when the local file is up to date, False if the fetch failed.
 
     Example:
         fetch_json_file("data", "data.json", "https://example.com/data.json")
     """
-    if not url:
-        logger.error("The URL provided is empty. Please provide a valid URL.")
-        return
-
-    try:
-        logger.info(f"Fetching JSON data from {url}...")
-        response = requests.get(url)
-        response.raise_for_status()
-        write_json_file(folder_name, filename, response.json())
-        logger.info(f"SUCCESS: JSON file fetched and saved as {filename}")
-    except requests.exceptions.HTTPError as http_err:
-        logger.error(f"HTTP error occurred: {http_err}")
-    except requests.exceptions.RequestException as req_err:
-        logger.error(f"Request error occurred: {req_err}")
-
-def write_json_file(folder_name: str, filename: str, json_data: dict) -> None:
+    if raw:
+        return download_file(folder_name, filename, url, write_json_file, "JSON")
+    else:
+        return download_file(folder_name, filename, url, write_json_file, "JSON", stream=False, read_body=lambda response: response.json())
+
+def write_json_file(
+    folder_name: str,
+    filename: str,
+    json_data: dict | list | Iterable[bytes],
+    unchanged_sha256: str | None = None,
+) -> str | None:
     """
     Write JSON data to a file.
 
+    Python objects are serialized by utils_json with a 4-space indent, which the
+    standard json module writes whatever backend is installed. Already-encoded
+    JSON (an iterable of byte chunks) is written unchanged. Either way the data
+    goes through a temporary file that is atomically renamed into place, so a
+    failed or interrupted write never leaves a partial file.
+
     Args:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
-        json_data (dict): JSON data to write to the file.
+        json_data (dict | list | Iterable[bytes]): JSON data to write to the file,
+            or the raw bytes of a JSON document as an iterable of chunks.
+        unchanged_sha256 (str | None): Hash of the current local file; when the new
+            content matches it, the existing file is left untouched.
 
     Returns:
-        None
+        str | None: SHA-256 hex digest of the written content, or None if the write failed.
     """
     file_path = pathlib.Path(folder_name).joinpath(filename)
     try:
         logger.info(f"Writing JSON data to {file_path}...")
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open('w') as file:
-            json.dump(json_data, file, indent=4)
+        if isinstance(json_data, (dict, list)):
+            json_data = utils_json.dumps(json_data, indent=4)
+        sha256 = write_chunks_atomically(file_path, as_chunks(json_data), unchanged_sha256)
         logger.info(f"SUCCESS: JSON data written to {file_path}")
+        return sha256
     except IOError as io_err:
         logger.error(f"Error writing JSON data to {file_path}: {io_err}")
+        return None
 
 #####################################
 # Define main() function
@@ -104,9 +121,8 @@ def main():
     """
     Main function to demonstrate fetching JSON data.
     """
-    json_url = 'https://raw.githubusercontent.com/claireszt/zodiac-json/refs/heads/main/zodiac.json'
     logger.info("Starting JSON fetch demonstration...")
-    fetch_json_file(FETCHED_DATA_DIR, "zodiac.json", json_url)
+    fetch_json_file(FETCHED_DATA_DIR, JSON_FILENAME, JSON_URL)
 
 #####################################
 # Conditional Execution
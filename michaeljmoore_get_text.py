@@ -23,77 +23,81 @@ Date: 2025-09-
 # Import from Python Standard Library
 import pathlib
 import sys
-
-# Import from external packages
-import requests
+from typing import Iterable
 
 # Ensure project root is in sys.path for local imports
 sys.path.append(str(pathlib.Path(__file__).resolve().parent))
 
 # Import local modules
 from utils_logger import logger
+from utils_fetch import as_chunks, download_file, write_chunks_atomically
 
 #####################################
 # Declare Global Variables
 #####################################
 
 FETCHED_DATA_DIR = "data"
+TXT_FILENAME = "wonkascript.txt"
+TXT_URL = 'https://wonkadotcom.tripod.com/wonkascript.txt'
 
 #####################################
 # Define Functions
 #####################################
 
-def fetch_txt_file(folder_name: str, filename: str, url: str) -> None:
+def fetch_txt_file(folder_name: str, filename: str, url: str) -> bool:
     """
     Fetch text data from the given URL and write it to a file.
 
+    If the file was fetched before, the request carries the ETag and Last-Modified
+    values from the fetch manifest, and nothing is written when the server answers
+    304 Not Modified or returns content identical to the local copy.
+
+    The body is streamed to disk in chunks and never held in memory as a whole.
+
     Args:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
         url (str): URL of the text file to fetch.
 
     Returns:
-        None
+        bool: True when the local file is up to date, False if the fetch failed.
 
     Example:
         fetch_txt_file("data", "romeo.txt", "https://example.com/romeo.txt")
     """
-    if not url:
-        logger.error("The URL provided is empty. Please provide a valid URL.")
-        return
-
-    try:
-        logger.info(f"Fetching text data from {url}...")
-        response = requests.get(url)
-        response.raise_for_status()
-        write_txt_file(folder_name, filename, response.text)
-        logger.info(f"SUCCESS: Text file fetched and saved as {filename}")
-    except requests.exceptions.HTTPError as http_err:
-        logger.error(f"HTTP error occurred: {http_err}")
-    except requests.exceptions.RequestException as req_err:
-        logger.error(f"Request error occurred: {req_err}")
-
-def write_txt_file(folder_name: str, filename: str, string_data: str) -> None:
+    return download_file(folder_name, filename, url, write_txt_file, "text")
+
+def write_txt_file(
+    folder_name: str,
+    filename: str,
+    string_data: str | Iterable[bytes],
+    unchanged_sha256: str | None = None,
+) -> str | None:
     """
     Write text data to a file.
 
+    The data is streamed through a temporary file that is atomically renamed
+    into place, so a failed or interrupted write never leaves a partial file.
+
     Args:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
-        string_data (str): Text content to write to the file.
+        string_data (str | Iterable[bytes]): Text content to write to the file, or an iterable of byte chunks.
+        unchanged_sha256 (str | None): Hash of the current local file; when the new
+            content matches it, the existing file is left untouched.
 
     Returns:
-        None
+        str | None: SHA-256 hex digest of the content, or None if the write failed.
     """
     file_path = pathlib.Path(folder_name).joinpath(filename)
     try:
         logger.info(f"Writing data to {file_path}...")
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open('w') as file:
-            file.write(string_data)
+        sha256 = write_chunks_atomically(file_path, as_chunks(string_data), unchanged_sha256)
         logger.info(f"SUCCESS: Data written to {file_path}")
+        return sha256
     except IOError as io_err:
         logger.error(f"Error writing to file {file_path}: {io_err}")
+        return None
 
 #####################################
 # Define main() function
@@ -103,9 +107,8 @@ def main():
     """
     Main function to demonstrate fetching text data.
     """
-    txt_url = 'https://wonkadotcom.tripod.com/wonkascript.txt'
     logger.info("Starting text fetch demonstration...")
-    fetch_txt_file(FETCHED_DATA_DIR, "wonkascript.txt", txt_url)
+    fetch_txt_file(FETCHED_DATA_DIR, TXT_FILENAME, TXT_URL)
 
 #####################################
 # Conditional Execution
@@ -6,6 +6,7 @@ Project: DataFun-03-Analytics
 Description:
     Process a CSV file (DisneyMovies_cleaned_data.csv) to analyze the 'Running time' column
     and save statistics (min, max, mean, standard deviation) to a text file in the 'processed' folder.
+    Several numeric columns can also be profiled together in one pass over the file.
 
 Usage:
     - Ensure utils_logger.py is present in the same directory.
@@ -22,14 +23,20 @@ Date: 2025-09-
 # Import from Python Standard Library
 import pathlib
 import csv
-import statistics
+import io
+import math
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
 
 # Ensure project root is in sys.path for local imports
 sys.path.append(str(pathlib.Path(__file__).resolve().parent))
 
 # Import local modules
-from utils_logger import logger
+from utils_logger import RepeatedWarning, logger
+from utils_stats import RunningStats
+import utils_result_cache
 
 #####################################
 # Declare Global Variables
@@ -39,48 +46,455 @@ from utils_logger import logger
 FETCHED_DATA_DIR: str = "data"
 PROCESSED_DIR: str = "processed"
 
+# Largest byte range handed to one worker by the parallel backend
+PARALLEL_CHUNK_BYTES: int = 16 * 1024 * 1024
+
+# Block size used when scanning for record boundaries
+BOUNDARY_SCAN_BYTES: int = 1024 * 1024
+
+# Numeric columns included in the combined column profile report
+PROFILE_COLUMNS: list[str] = ["Running time", "Box office", "Budget"]
+
 #####################################
 # Define Functions
 #####################################
 
 
 def analyze_running_time(file_path: pathlib.Path) -> dict:
-    """Analyze the Running Time column to calculate min, max, mean, and stdev."""
+    """
+    Analyze the Running Time column to calculate min, max, mean, and stdev.
+
+    Rows are read with a plain csv.reader and fed into a RunningStats accumulator,
+    so the file is scanned once and memory use does not grow with the row count.
+    Only the first few invalid rows are logged individually, followed by a count.
+    """
     try:
-        # initialize an empty list to store the scores
-        run_list = []
-        with file_path.open('r', encoding='utf-8') as file:
-            # csv.DictReader() methods to read into a DictReader so we can access named columns in the csv file
-            dict_reader = csv.DictReader(file)  
-            for row in dict_reader:
+        stats = RunningStats()
+        skipped = RepeatedWarning("Skipped rows with an invalid Running time")
+        with file_path.open('r', encoding='utf-8', newline='') as file, skipped:
+            reader = csv.reader(file)
+            header = next(reader)
+            column_index = header.index("Running time")
+            for row in reader:
                 try:
-                    time = float(row["Running time"])  # Extract and convert to float
-                    # append the score to the list
-                    run_list.append(time)
-                except ValueError as e:
-                    logger.warning(f"Skipping invalid row: {row} ({e})")
-        
-        # Calculate statistics
-        stats = {
-            "min": min(run_list),
-            "max": max(run_list),
-            "mean": statistics.mean(run_list),
-            "stdev": statistics.stdev(run_list) if len(run_list) > 1 else 0,
+                    stats.add(float(row[column_index]))  # Extract and convert to float
+                except (ValueError, IndexError) as e:
+                    # Build the named-column view only for the rows we report
+                    skipped(lambda: f"Skipping invalid row: {dict(zip(header, row))} ({e})")
+
+        if stats.count == 0:
+            logger.error(f"No valid Running time values found in {file_path}")
+        return stats.as_dict()
+    except Exception as e:
+        logger.error(f"Error processing CSV file: {e}")
+        return {}
+
+def analyze_running_time_vectorized(file_path: pathlib.Path, column: str = "Running time") -> dict:
+    """
+    Vectorized version of analyze_running_time() backed by pandas and NumPy.
+
+    Only the requested column is loaded, as strings, and converted to a float64 array
+    in one call. Unparseable or empty values become NaN and are counted in a single
+    warning instead of being logged row by row.
+
+    Falls back to analyze_running_time() when pandas/NumPy are not installed.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        column (str): Name of the numeric column to analyze.
+
+    Returns:
+        dict: Keys min, max, mean and stdev, or an empty dict on error.
+    """
+    # Optional and slow to import, so only loaded when the vectorized backend is used
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        logger.warning("pandas/numpy not installed, using the pure-Python CSV backend")
+        return analyze_running_time(file_path)
+
+    try:
+        frame = pd.read_csv(file_path, usecols=[column], dtype={column: str}, encoding='utf-8')
+        values = pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=np.float64)
+        valid = values[~np.isnan(values)]
+
+        skipped = values.size - valid.size
+        if skipped:
+            logger.warning(f"Skipped {skipped} rows with missing or invalid '{column}' values")
+        if valid.size == 0:
+            logger.error(f"No valid {column} values found in {file_path}")
+            return {}
+
+        return {
+            "min": float(valid.min()),
+            "max": float(valid.max()),
+            "mean": float(valid.mean()),
+            "stdev": float(valid.std(ddof=1)) if valid.size > 1 else 0,
         }
-        return stats
     except Exception as e:
         logger.error(f"Error processing CSV file: {e}")
         return {}
 
-def process_csv_file():
-    """Read a CSV file, analyze Running Time, and save the results."""
+def find_record_boundaries(file_path: pathlib.Path, chunk_bytes: int) -> list[int]:
+    """
+    Split a CSV file into byte ranges that each start and end on a record boundary.
+
+    A newline only ends a record when it is outside a quoted field, so the scan
+    tracks quote parity from the start of the file. Doubled quotes inside a field
+    ("") toggle the parity twice and leave it unchanged, which keeps multi-line
+    quoted fields (such as the list-valued "Directed by" column) in one range.
+    The scan reads fixed-size blocks and only counts bytes, so it is fast and uses
+    constant memory.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        chunk_bytes (int): Approximate size of each range.
+
+    Returns:
+        list[int]: Offsets [end of header, boundary, ..., file size]; consecutive
+        pairs are the data ranges, and the header record is before the first offset.
+    """
+    file_size = file_path.stat().st_size
+    boundaries: list[int] = []
+    target = 0  # The first boundary is the end of the header record
+    in_quotes = False
+    block_start = 0
+    with file_path.open('rb') as file:
+        while block_start < file_size:
+            block = file.read(BOUNDARY_SCAN_BYTES)
+            if not block:
+                break
+            position = 0  # Quote parity in in_quotes is known up to this offset in the block
+            while True:
+                search_from = max(target - block_start, position)
+                newline = block.find(b"\n", search_from)
+                if newline == -1:
+                    break
+                in_quotes ^= block.count(b'"', position, newline) % 2 == 1
+                position = newline
+                if not in_quotes:
+                    boundary = block_start + newline + 1
+                    boundaries.append(boundary)
+                    target = boundary + chunk_bytes
+                position = newline + 1
+            in_quotes ^= block.count(b'"', position) % 2 == 1
+            block_start += len(block)
+
+    if not boundaries or boundaries[-1] < file_size:
+        boundaries.append(file_size)
+    return boundaries
+
+def _profile_targets(file_path: pathlib.Path, header: list[str], columns: list[str]) -> list[tuple[str, int]]:
+    """Return (column name, column index) for each profiled column in the header, warning about missing ones."""
+    targets = []
+    for column in columns:
+        if column not in header:
+            logger.warning(f"Column '{column}' not found in {file_path}, skipping")
+            continue
+        targets.append((column, header.index(column)))
+    return targets
+
+def _new_accumulators(targets: list[tuple[str, int]]) -> list[tuple[str, int, RunningStats, dict]]:
+    """Return (column name, column index, stats, null/invalid counters) for each profiled column."""
+    return [(column, index, RunningStats(), {"nulls": 0, "invalid": 0}) for column, index in targets]
+
+def _profile_rows(
+    rows: Iterable[list[str]],
+    header: list[str],
+    accumulators: list[tuple[str, int, RunningStats, dict]],
+    skipped: RepeatedWarning,
+) -> None:
+    """Add every row to the accumulators: empty cells are nulls, non-numeric cells are invalid."""
+    for row in rows:
+        for column, index, stats, counters in accumulators:
+            value = row[index].strip() if index < len(row) else ""
+            if not value:
+                counters["nulls"] += 1
+                continue
+            try:
+                stats.add(float(value))
+            except ValueError:
+                counters["invalid"] += 1
+                skipped(lambda: f"Skipping invalid '{column}' value in row: {dict(zip(header, row))}")
+
+def _build_profile(accumulators: list[tuple[str, int, RunningStats, dict]]) -> dict:
+    """Turn accumulators into the profile_csv_columns() result format."""
+    profile = {}
+    for column, _, stats, counters in accumulators:
+        summary = stats.as_dict() or dict.fromkeys(("min", "max", "mean", "stdev"))
+        profile[column] = {"count": stats.count, **counters, **summary}
+    return profile
+
+def profile_csv_columns(file_path: pathlib.Path, columns: list[str]) -> dict:
+    """
+    Profile several numeric columns of a CSV file in a single pass.
+
+    Each column gets its own RunningStats accumulator, so adding columns does not
+    add passes over the file. Empty cells are counted as nulls and cells that
+    cannot be converted to float are counted as invalid.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        columns (list[str]): Names of the numeric columns to profile.
+
+    Returns:
+        dict: Column name -> dict with count, nulls, invalid, min, max, mean and stdev
+        (min/max/mean/stdev are None when a column has no valid values).
+        Columns missing from the header are left out. Empty dict on error.
+    """
+    try:
+        skipped = RepeatedWarning("Skipped invalid values in profiled columns")
+        with file_path.open('r', encoding='utf-8', newline='') as file, skipped:
+            reader = csv.reader(file)
+            header = next(reader)
+            accumulators = _new_accumulators(_profile_targets(file_path, header, columns))
+            _profile_rows(reader, header, accumulators, skipped)
+        return _build_profile(accumulators)
+    except Exception as e:
+        logger.error(f"Error profiling CSV file: {e}")
+        return {}
+
+def _analyze_csv_range(
+    file_path: pathlib.Path,
+    start: int,
+    end: int,
+    header: list[str],
+    targets: list[tuple[str, int]],
+) -> tuple[list[tuple[str, int, RunningStats, dict]], RepeatedWarning]:
+    """Worker: accumulate the column profile of one byte range of the file."""
+    accumulators = _new_accumulators(targets)
+    # Only collect sample messages here; the parent logs them within one limit for the whole run
+    skipped = RepeatedWarning("Skipped invalid values in profiled columns", collect=True)
+    with file_path.open('rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    _profile_rows(csv.reader(io.StringIO(data.decode('utf-8'), newline='')), header, accumulators, skipped)
+    return accumulators, skipped
+
+def profile_csv_columns_parallel(
+    file_path: pathlib.Path,
+    columns: list[str],
+    workers: int | None = None,
+    chunk_bytes: int = PARALLEL_CHUNK_BYTES,
+) -> dict:
+    """
+    Parallel version of profile_csv_columns() that spreads parsing over CPU cores.
+
+    The file is split into byte ranges aligned on record boundaries. Each worker
+    process profiles one range with its own accumulators, and the partial results
+    are merged with the parallel variance combination, so the profile matches a
+    single sequential pass.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        columns (list[str]): Names of the numeric columns to profile.
+        workers (int | None): Number of worker processes (defaults to the CPU count).
+        chunk_bytes (int): Largest byte range parsed by one worker task.
+
+    Returns:
+        dict: Same format as profile_csv_columns(). Empty dict on error.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    try:
+        with file_path.open('r', encoding='utf-8', newline='') as file:
+            header = next(csv.reader(file))
+        targets = _profile_targets(file_path, header, columns)
+
+        # Aim for at least one range per worker, but never more than chunk_bytes each
+        data_bytes = file_path.stat().st_size
+        chunk_bytes = max(1, min(chunk_bytes, math.ceil(data_bytes / workers)))
+        boundaries = find_record_boundaries(file_path, chunk_bytes)
+        starts, ends = boundaries[:-1], boundaries[1:]
+
+        accumulators = _new_accumulators(targets)
+        skipped = RepeatedWarning("Skipped invalid values in profiled columns")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = executor.map(
+                _analyze_csv_range,
+                [file_path] * len(starts),
+                starts,
+                ends,
+                [header] * len(starts),
+                [targets] * len(starts),
+            )
+            for partial_accumulators, partial_skipped in partials:
+                for (_, _, stats, counters), partial in zip(accumulators, partial_accumulators):
+                    _, _, partial_stats, partial_counters = partial
+                    stats.merge(partial_stats)
+                    counters["nulls"] += partial_counters["nulls"]
+                    counters["invalid"] += partial_counters["invalid"]
+                skipped.merge(partial_skipped)
+        skipped.log_summary()
+
+        logger.info(f"Profiled {file_path} in {len(starts)} ranges with {workers} workers")
+        return _build_profile(accumulators)
+    except Exception as e:
+        logger.error(f"Error profiling CSV file: {e}")
+        return {}
+
+def analyze_running_time_parallel(
+    file_path: pathlib.Path,
+    workers: int | None = None,
+    column: str = "Running time",
+    chunk_bytes: int = PARALLEL_CHUNK_BYTES,
+) -> dict:
+    """
+    Parallel version of analyze_running_time(), built on profile_csv_columns_parallel().
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        workers (int | None): Number of worker processes (defaults to the CPU count).
+        column (str): Name of the numeric column to analyze.
+        chunk_bytes (int): Largest byte range parsed by one worker task.
+
+    Returns:
+        dict: Keys min, max, mean and stdev, or an empty dict on error.
+    """
+    profile = profile_csv_columns_parallel(file_path, [column], workers=workers, chunk_bytes=chunk_bytes)
+    return running_time_from_profile(profile, column)
+
+def profile_csv_columns_vectorized(file_path: pathlib.Path, columns: list[str]) -> dict:
+    """
+    Vectorized version of profile_csv_columns() backed by pandas and NumPy.
+
+    Only the profiled columns are loaded, as strings, and each one is converted to a
+    float64 array in one call, so no Python code runs per row. Nulls and invalid
+    values are counted the same way: empty cells are nulls, and non-empty cells that
+    are not numbers are invalid.
+
+    Falls back to profile_csv_columns() when pandas/NumPy are not installed.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        columns (list[str]): Names of the numeric columns to profile.
+
+    Returns:
+        dict: Same format as profile_csv_columns(). Empty dict on error.
+    """
+    # Optional and slow to import, so only loaded when the vectorized backend is used
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        logger.warning("pandas/numpy not installed, using the pure-Python CSV backend")
+        return profile_csv_columns(file_path, columns)
+
+    try:
+        with file_path.open('r', encoding='utf-8', newline='') as file:
+            header = next(csv.reader(file))
+        names = [column for column, _ in _profile_targets(file_path, header, columns)]
+
+        # Only empty cells become NaN, so text such as "NA" still counts as invalid;
+        # a column with no invalid text is parsed straight to float64 by the C reader
+        frame = pd.read_csv(file_path, usecols=names, keep_default_na=False, na_values=[""], encoding='utf-8')
+
+        profile = {}
+        for column in names:
+            values = pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=np.float64)
+            missing = np.isnan(values)
+            valid = values[~missing]
+
+            # Cells that are not numbers are nulls when blank and invalid otherwise
+            unparsed = frame[column][missing]
+            blank = int((unparsed.isna() | (unparsed.astype(str).str.strip() == "")).sum())
+
+            summary = dict.fromkeys(("min", "max", "mean", "stdev"))
+            if valid.size:
+                summary = {
+                    "min": float(valid.min()),
+                    "max": float(valid.max()),
+                    "mean": float(valid.mean()),
+                    "stdev": float(valid.std(ddof=1)) if valid.size > 1 else 0.0,
+                }
+            profile[column] = {
+                "count": int(valid.size),
+                "nulls": blank,
+                "invalid": int(missing.sum()) - blank,
+                **summary,
+            }
+        return profile
+    except Exception as e:
+        logger.error(f"Error profiling CSV file: {e}")
+        return {}
+
+def write_column_profile(output_file: pathlib.Path, profile: dict) -> None:
+    """Write a column profile from profile_csv_columns() to a text report."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with output_file.open('w') as file:
+        file.write("Column Profile:\n")
+        for column, summary in profile.items():
+            file.write(f"\n{column}\n")
+            file.write(f"Count: {summary['count']}\n")
+            file.write(f"Nulls: {summary['nulls']}\n")
+            file.write(f"Invalid: {summary['invalid']}\n")
+            if summary["count"] == 0:
+                continue
+            file.write(f"Minimum: {summary['min']:.2f}\n")
+            file.write(f"Maximum: {summary['max']:.2f}\n")
+            file.write(f"Mean: {summary['mean']:.2f}\n")
+            file.write(f"Standard Deviation: {summary['stdev']:.2f}\n")
+
+def running_time_from_profile(profile: dict, column: str = "Running time") -> dict:
+    """
+    Return analyze_running_time()-style statistics from a profile_csv_columns() result.
+
+    Args:
+        profile (dict): Column profile that includes `column`.
+        column (str): Name of the numeric column.
+
+    Returns:
+        dict: Keys min, max, mean and stdev, or an empty dict if the column has no valid values.
+    """
+    summary = profile.get(column)
+    if not summary or summary["count"] == 0:
+        logger.error(f"No valid {column} values found")
+        return {}
+    skipped = summary["nulls"] + summary["invalid"]
+    if skipped:
+        logger.warning(f"Skipped {skipped} rows with missing or invalid '{column}' values")
+    return {key: summary[key] for key in ("min", "max", "mean", "stdev")}
+
+def process_csv_file(vectorized: bool = False, workers: int = 1):
+    """
+    Read a CSV file, analyze Running Time and profile numeric columns, and save the results.
+
+    The file is scanned once with every backend: Running time is one of the
+    PROFILE_COLUMNS, so its statistics are taken from the column profile.
+
+    Args:
+        vectorized (bool): Build the column profile with the pandas/NumPy backend
+            instead of the pure-Python one.
+        workers (int): When greater than 1 (and not vectorized), build the column
+            profile with this many worker processes.
+
+    Nothing is recomputed when the input file and this script are unchanged since the
+    last run. vectorized and workers only choose a backend, so they are not part of the
+    cache key.
+    """
     
     input_file = pathlib.Path(FETCHED_DATA_DIR, "DisneyMovies_cleaned_data.csv")
     
     output_file = pathlib.Path(PROCESSED_DIR, "disney_running_time_stats.txt")
+
+    profile_file = pathlib.Path(PROCESSED_DIR, "disney_column_profile.txt")
+
+    # Skip the work if the input and this script are unchanged and the outputs exist
+    cache_inputs = [input_file, pathlib.Path(__file__)]
+    cache_outputs = [output_file, profile_file]
+    if utils_result_cache.is_current("process_csv", cache_inputs, cache_outputs):
+        return
     
+    # Profile all numeric columns in one pass
+    if vectorized:
+        profile = profile_csv_columns_vectorized(input_file, PROFILE_COLUMNS)
+    elif workers > 1:
+        profile = profile_csv_columns_parallel(input_file, PROFILE_COLUMNS, workers=workers)
+    else:
+        profile = profile_csv_columns(input_file, PROFILE_COLUMNS)
+
     # Call the function to analyze the Running Time column
-    stats = analyze_running_time(input_file)
+    stats = running_time_from_profile(profile)
 
     # Create the output directory if it doesn't exist
     output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -94,8 +508,12 @@ def process_csv_file():
         file.write(f"Mean: {stats['mean']:.2f}\n")
         file.write(f"Standard Deviation: {stats['stdev']:.2f}\n")
     
+    # Write the combined profile report
+    write_column_profile(profile_file, profile)
+    utils_result_cache.record("process_csv", cache_inputs, cache_outputs)
+
     # Log the processing of the CSV file
-    logger.info(f"Processed CSV file: {input_file}, Statistics saved to: {output_file}")
+    logger.info(f"Processed CSV file: {input_file}, Statistics saved to: {output_file} and {profile_file}")
 
 #####################################
 # Main Execution
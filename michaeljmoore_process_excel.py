@@ -6,6 +6,7 @@ Project: DataFun-03-Analytics
 Description:
     Process an Excel file (Lottery_Powerball_Winning_Numbers__Beginning_2010.xlsx) to count occurrences
     of a specific word in a given column and save the result to a text file in the 'processed' folder.
+    Many terms across many columns can also be counted together in one pass over the sheet.
 
 Usage:
     - Ensure utils_logger.py is present in the same directory.
@@ -20,17 +21,24 @@ Date: 2025-09-12
 #####################################
 
 # Import from Python Standard Library
+import bisect
+import datetime
+import hashlib
+import heapq
+import json
 import pathlib
 import sys
-
-# Import from external packages
-import openpyxl
+from collections import Counter
+from typing import Iterable, Iterator
 
 # Ensure project root is in sys.path for local imports
 sys.path.append(str(pathlib.Path(__file__).resolve().parent))
 
 # Import local modules
-from utils_logger import logger
+from utils_files import AtomicWriter
+from utils_logger import RepeatedWarning, logger
+from utils_excel_cache import load_cached_column
+import utils_result_cache
 
 #####################################
 # Declare Global Variables
@@ -40,26 +48,312 @@ from utils_logger import logger
 FETCHED_DATA_DIR: str = "data"
 PROCESSED_DIR: str = "processed"
 
+# Each "Winning Numbers" cell lists the five white balls (01-69) followed by the red Powerball (01-26)
+WHITE_BALLS: slice = slice(0, 5)
+POWERBALL: slice = slice(5, 6)
+
+# Term queries answered in one pass: column letter -> terms (every white ball number)
+BALL_NUMBER_QUERIES: dict[str, list[str]] = {"B": [f"{number:02d}" for number in range(1, 70)]}
+
+# Tokens of each cell counted for BALL_NUMBER_QUERIES, so the Powerball is not tallied as a white ball
+BALL_NUMBER_TOKENS: dict[str, slice] = {"B": WHITE_BALLS}
+
+# Number of hot numbers listed in the report
+HOT_NUMBER_COUNT: int = 10
+
 #####################################
 # Define Functions
 #####################################
 
-def count_word_in_column(file_path: pathlib.Path, column_letter: str, word: str) -> int:
-    """Count the occurrences of a specific word in a given column of an Excel file."""
+def iter_column_values(file_path: pathlib.Path, column_letter: str) -> Iterator:
+    """
+    Yield the values of one column of the active sheet straight from the workbook.
+
+    The workbook is opened in read-only mode and only the target column is streamed,
+    so memory use does not grow with the width of the sheet.
+    """
+    # openpyxl is slow to import and not needed when columns come from the cache
+    import openpyxl
+    from openpyxl.utils import column_index_from_string
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        sheet = workbook.active
+        column_index = column_index_from_string(column_letter)
+        for (value,) in sheet.iter_rows(min_col=column_index, max_col=column_index, values_only=True):
+            yield value
+    finally:
+        # Read-only workbooks keep the file open until closed
+        workbook.close()
+
+def iter_rows_for_columns(file_path: pathlib.Path, column_letters: list[str]) -> Iterator[tuple]:
+    """
+    Yield rows restricted to the given columns straight from the workbook, in one pass.
+
+    Only the span of columns between the leftmost and rightmost requested column is read.
+    """
+    import openpyxl
+    from openpyxl.utils import column_index_from_string
+
+    indexes = [column_index_from_string(letter) for letter in column_letters]
+    first, last = min(indexes), max(indexes)
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
     try:
-        workbook = openpyxl.load_workbook(file_path)
         sheet = workbook.active
+        for row in sheet.iter_rows(min_col=first, max_col=last, values_only=True):
+            yield tuple(row[index - first] if index - first < len(row) else None for index in indexes)
+    finally:
+        workbook.close()
+
+def read_column(file_path: pathlib.Path, column_letter: str, use_cache: bool = True) -> Iterable:
+    """
+    Return the values of one column of the active sheet.
+
+    With use_cache, values come from the columnar sidecar cache, which is built
+    on first use and rebuilt whenever the workbook changes. openpyxl is only used
+    directly when the cache is disabled or cannot be used.
+    """
+    if use_cache:
+        values = load_cached_column(file_path, column_letter)
+        if values is not None:
+            return values
+    return iter_column_values(file_path, column_letter)
+
+def count_word_in_column(file_path: pathlib.Path, column_letter: str, word: str, use_cache: bool = True) -> int:
+    """
+    Count the occurrences of a specific word in a given column of an Excel file.
+
+    Set use_cache=False to always read the workbook itself instead of the column cache.
+    """
+    try:
+        word = word.lower()
         count = 0
-        for cell in sheet[column_letter]:
-            if cell.value and isinstance(cell.value, str):
-                count += cell.value.lower().count(word.lower())
+        for value in read_column(file_path, column_letter, use_cache):
+            if value and isinstance(value, str):
+                count += value.lower().count(word)
         return count
     except Exception as e:
         logger.error(f"Error reading Excel file: {e}")
         return 0
 
+def tokenize_cell(value) -> list[str]:
+    """Split a cell into lowercase whitespace-separated tokens (integers become one token)."""
+    if isinstance(value, str):
+        return value.lower().split()
+    if isinstance(value, int) and not isinstance(value, bool):
+        return [str(value)]
+    return []
+
+def count_terms_in_columns(
+    file_path: pathlib.Path,
+    queries: dict[str, Iterable[str]],
+    use_cache: bool = True,
+    tokens: dict[str, slice] | None = None,
+) -> dict[str, dict[str, int]]:
+    """
+    Count many terms in many columns of an Excel file in a single pass.
+
+    Each cell is tokenized once and the tokens are tallied per column, so every term
+    is answered from the same tally. A term only matches a whole token: "12" counts
+    the ball number 12 but not the "12" inside "112" (unlike count_word_in_column(),
+    which counts substrings). Matching is case-insensitive.
+
+    Args:
+        file_path (pathlib.Path): Path to the Excel file.
+        queries (dict[str, Iterable[str]]): Column letter -> terms to count in that column.
+        use_cache (bool): Read columns from the columnar cache instead of the workbook.
+        tokens (dict[str, slice] | None): Column letter -> positions of each cell's tokens
+            to count, e.g. WHITE_BALLS. Columns not listed count every token.
+
+    Returns:
+        dict[str, dict[str, int]]: Column letter -> term -> count, in query order.
+        Empty dict on error.
+
+    Example:
+        count_terms_in_columns(path, {"B": ["01", "12"], "C": ["2", "3"]})
+    """
+    try:
+        letters = [letter.upper() for letter in queries]
+        tallies = [Counter() for _ in letters]
+        token_slices = {letter.upper(): token_slice for letter, token_slice in (tokens or {}).items()}
+        positions = [token_slices.get(letter, slice(None)) for letter in letters]
+
+        columns = [load_cached_column(file_path, letter) for letter in letters] if use_cache else []
+        if use_cache and all(column is not None for column in columns):
+            for tally, column, position in zip(tallies, columns, positions):
+                for value in column:
+                    tally.update(tokenize_cell(value)[position])
+        else:
+            for row in iter_rows_for_columns(file_path, letters):
+                for tally, value, position in zip(tallies, row, positions):
+                    tally.update(tokenize_cell(value)[position])
+
+        return {
+            letter: {term: tally[term.lower()] for term in terms}
+            for letter, tally, terms in zip(letters, tallies, queries.values())
+        }
+    except Exception as e:
+        logger.error(f"Error reading Excel file: {e}")
+        return {}
+
+#####################################
+# Define Classes
+#####################################
+
+class DrawFrequencyIndex:
+    """
+    Frequency index of the winning numbers, built by tokenizing each draw once.
+
+    The five white balls and the red Powerball are drawn from different pools, so
+    they are indexed separately ("white" and "powerball"). For every ball number the
+    index keeps the sorted dates of the draws it appeared in, so queries never rescan
+    the sheet:
+    - count(number, pool): O(1)
+    - top(n, pool): O(k) over the distinct numbers
+    - count_between(number, start, end, pool): O(log draws) with binary search
+
+    update_from_workbook() only indexes rows appended since the last update. It keeps a
+    SHA-256 of every row consumed so far and rebuilds from scratch when any of those
+    rows has been edited, removed or reordered.
+
+    Example:
+        index = DrawFrequencyIndex.load(index_file)
+        index.update_from_workbook(excel_file)
+        index.count(12), index.top(5), index.top(5, pool="powerball")
+        index.save(index_file)
+    """
+
+    VERSION = 3
+
+    # Ball pools: the first five numbers of a draw are white balls, the sixth is the Powerball
+    POOLS: tuple[str, ...] = ("white", "powerball")
+
+    def __init__(self) -> None:
+        self.dates_by_number: dict[str, dict[int, list[str]]] = {pool: {} for pool in self.POOLS}
+        self.rows_indexed: int = 0  # Sheet rows consumed, including the header and skipped rows
+        self.prefix_sha256: str | None = None  # Hash of the consumed rows, to detect edits
+
+    @staticmethod
+    def _hash_rows(digest, rows: Iterable[tuple]) -> None:
+        """Feed rows into a running hash, one line per row."""
+        for draw_date, numbers in rows:
+            digest.update(f"{draw_date!r}|{numbers!r}\n".encode('utf-8'))
+
+    def add_draw(self, draw_date: datetime.date, numbers: Iterable[int], pool: str = "white") -> None:
+        """Index the numbers of one draw from one pool."""
+        day = draw_date.isoformat()
+        dates_by_number = self.dates_by_number[pool]
+        for number in numbers:
+            bisect.insort(dates_by_number.setdefault(number, []), day)
+
+    def count(self, number: int, pool: str = "white") -> int:
+        """Return how many times a number was drawn from a pool."""
+        return len(self.dates_by_number[pool].get(number, ()))
+
+    def top(self, n: int, pool: str = "white") -> list[tuple[int, int]]:
+        """Return the n most frequently drawn numbers of a pool as (number, count), hottest first."""
+        return heapq.nlargest(n, ((number, len(days)) for number, days in self.dates_by_number[pool].items()),
+                              key=lambda item: (item[1], -item[0]))
+
+    def count_between(self, number: int, start: datetime.date, end: datetime.date, pool: str = "white") -> int:
+        """Return how many times a number was drawn from a pool between start and end, inclusive."""
+        days = self.dates_by_number[pool].get(number, [])
+        return bisect.bisect_right(days, end.isoformat()) - bisect.bisect_left(days, start.isoformat())
+
+    def update_from_workbook(
+        self,
+        file_path: pathlib.Path,
+        date_column: str = "A",
+        numbers_column: str = "B",
+        use_cache: bool = True,
+    ) -> int:
+        """
+        Index draws appended to the workbook since the last update.
+
+        The rows indexed before are hashed again and compared with the stored hash,
+        so an edit anywhere in them (not only in the last row) triggers a rebuild.
+
+        Args:
+            file_path (pathlib.Path): Path to the Excel file.
+            date_column (str): Column holding the draw dates.
+            numbers_column (str): Column holding the space-separated winning numbers
+                (five white balls, then the Powerball).
+            use_cache (bool): Read columns from the columnar cache instead of the workbook.
+
+        Returns:
+            int: Number of newly indexed draws.
+        """
+        dates = list(read_column(file_path, date_column, use_cache))
+        numbers = list(read_column(file_path, numbers_column, use_cache))
+        rows = list(zip(dates, numbers))
+
+        digest = hashlib.sha256()
+        if self.rows_indexed:
+            self._hash_rows(digest, rows[:self.rows_indexed])
+            if len(rows) < self.rows_indexed or digest.hexdigest() != self.prefix_sha256:
+                logger.info(f"Earlier rows of {file_path} changed, rebuilding the frequency index")
+                self.__init__()
+                digest = hashlib.sha256()
+
+        added = 0
+        with RepeatedWarning("Skipped draws with non-numeric winning numbers") as skipped:
+            for draw_date, cell in rows[self.rows_indexed:]:
+                if isinstance(draw_date, (datetime.date, datetime.datetime)) and isinstance(cell, str):
+                    if isinstance(draw_date, datetime.datetime):
+                        draw_date = draw_date.date()
+                    try:
+                        balls = [int(token) for token in cell.split()]
+                        self.add_draw(draw_date, balls[WHITE_BALLS], "white")
+                        self.add_draw(draw_date, balls[POWERBALL], "powerball")
+                        added += 1
+                    except ValueError:
+                        skipped(f"Skipping draw with non-numeric winning numbers: {cell!r}")
+        self._hash_rows(digest, rows[self.rows_indexed:])
+        self.rows_indexed = len(rows)
+        self.prefix_sha256 = digest.hexdigest()
+        return added
+
+    def save(self, index_file: pathlib.Path) -> None:
+        """Write the index to a JSON file atomically."""
+        with AtomicWriter(index_file, 'w', encoding='utf-8') as file:
+            json.dump({
+                "version": self.VERSION,
+                "rows_indexed": self.rows_indexed,
+                "prefix_sha256": self.prefix_sha256,
+                "dates_by_number": {
+                    pool: {str(number): days for number, days in sorted(dates_by_number.items())}
+                    for pool, dates_by_number in self.dates_by_number.items()
+                },
+            }, file)
+
+    @classmethod
+    def load(cls, index_file: pathlib.Path) -> "DrawFrequencyIndex":
+        """Read an index saved with save(), or return an empty index if there is none."""
+        index = cls()
+        try:
+            with index_file.open('r', encoding='utf-8') as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return index
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable frequency index {index_file}: {e}")
+            return index
+        if data.get("version") != cls.VERSION:
+            return index
+        index.rows_indexed = data["rows_indexed"]
+        index.prefix_sha256 = data["prefix_sha256"]
+        index.dates_by_number = {
+            pool: {int(number): days for number, days in data["dates_by_number"][pool].items()}
+            for pool in cls.POOLS
+        }
+        return index
+
+#####################################
+# Process the Excel File
+#####################################
+
 def process_excel_file():
-    """Read an Excel file, count occurrences of 'GitHub' in a specific column, and save the result."""
+    """Read an Excel file, count occurrences of '12' and of every white ball number in column B, and save the results."""
     
     
     input_file = pathlib.Path(FETCHED_DATA_DIR, "Lottery_Powerball_Winning_Numbers__Beginning_2010.xlsx")
@@ -67,14 +361,37 @@ def process_excel_file():
     
     output_file = pathlib.Path(PROCESSED_DIR, "number_occurred.txt")
 
+    index_file = pathlib.Path(PROCESSED_DIR, "powerball_frequency_index.json")
+
    
     column_to_check = "B"  
 
    
     word_to_count = "12"
 
+    # Skip the work if the input and this script are unchanged and the outputs exist
+    cache_inputs = [input_file, pathlib.Path(__file__)]
+    cache_outputs = [output_file, index_file]
+    cache_params = {"column": column_to_check, "word": word_to_count}
+    if utils_result_cache.is_current("process_excel", cache_inputs, cache_outputs, cache_params):
+        return
+
     # Call the function to count occurrences of the word in the specified column
     word_count = count_word_in_column(input_file, column_to_check, word_to_count)
+
+    # Count every white ball number as a whole token in one pass
+    term_counts = count_terms_in_columns(input_file, BALL_NUMBER_QUERIES, tokens=BALL_NUMBER_TOKENS)
+
+    # Bring the persisted frequency index up to date with any newly appended draws
+    frequency_index = DrawFrequencyIndex.load(index_file)
+    index_updated = False
+    try:
+        new_draws = frequency_index.update_from_workbook(input_file)
+        frequency_index.save(index_file)
+        index_updated = True
+        logger.info(f"Frequency index updated with {new_draws} new draws: {index_file}")
+    except Exception as e:
+        logger.error(f"Error updating frequency index: {e}")
     
     # Write the results to the output file    
     output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -83,6 +400,25 @@ def process_excel_file():
     with output_file.open('w') as file:
         
         file.write(f"Occurrences of '{word_to_count}' in column {column_to_check}: {word_count}\n")
+
+        for column, counts in term_counts.items():
+            file.write(f"\nWhole-number white-ball occurrences in column {column} (Powerball excluded):\n")
+            for term, count in counts.items():
+                file.write(f"'{term}': {count}\n")
+
+        file.write(f"\nTop {HOT_NUMBER_COUNT} hot white-ball numbers:\n")
+        for number, count in frequency_index.top(HOT_NUMBER_COUNT, "white"):
+            file.write(f"{number:02d}: {count}\n")
+
+        file.write(f"\nTop {HOT_NUMBER_COUNT} hot Powerball numbers:\n")
+        for number, count in frequency_index.top(HOT_NUMBER_COUNT, "powerball"):
+            file.write(f"{number:02d}: {count}\n")
+
+    # Only keep the result if every output was rewritten from the current input
+    if index_updated and term_counts:
+        utils_result_cache.record("process_excel", cache_inputs, cache_outputs, cache_params)
+    else:
+        utils_result_cache.forget("process_excel")
     
     # Log the processing of the Excel file    
     logger.info(f"Processed Excel file: {input_file}, Word count saved to: {output_file}")
@@ -5,7 +5,8 @@ Project: DataFun-03-Analytics
 
 Description:
     Process a JSON file (zodiac.json) to count the number of famous people for each zodiac sign
-    and save the results to a text file in the 'processed' folder.
+    and save the results to a text file in the 'processed' folder. A list of declarative
+    group-by aggregations is also evaluated in one pass over the zodiac signs.
 
 Usage:
     - Ensure utils_logger.py is present in the same directory.
@@ -23,12 +24,16 @@ Date: 2025-09
 import json
 import pathlib
 import sys
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
 
 # Ensure project root is in sys.path for local imports
 sys.path.append(str(pathlib.Path(__file__).resolve().parent))
 
 # Import local modules
 from utils_logger import logger
+from utils_stats import RunningStats
+import utils_json
+import utils_result_cache
 
 #####################################
 # Declare Global Variables
@@ -38,6 +43,61 @@ from utils_logger import logger
 FETCHED_DATA_DIR: str = "data"
 PROCESSED_DIR: str = "processed"
 
+# Characters read per chunk by the streaming JSON parser
+JSON_CHUNK_CHARS: int = 64 * 1024
+
+# Aggregate functions understood by aggregate_records()
+AGGREGATE_FUNCTIONS: tuple[str, ...] = ("count", "sum", "min", "max", "mean", "stats")
+
+#####################################
+# Define Classes
+#####################################
+
+class Aggregation(NamedTuple):
+    """
+    One declarative aggregation query over a list of JSON records.
+
+    Attributes:
+        name (str): Label used in the results.
+        function (str): One of AGGREGATE_FUNCTIONS. "count" counts records; the others
+            aggregate the value found at `value`.
+        group_by (str | None): Dotted key path to group records by (None for one overall group).
+            When the value at the path is a list, the record counts once for each element.
+        value (str | None): Dotted key path of the value to aggregate.
+        transform (Callable | None): Applied to the value before aggregating, e.g. len.
+        group_default (Any): Group for records without a value at `group_by`
+            (None skips those records).
+        value_default (Any): Value for records without a value at `value`
+            (None skips those records).
+
+    Example:
+        Aggregation("summary_length", "stats", value="summary", transform=len)
+    """
+    name: str
+    function: str
+    group_by: str | None = None
+    value: str | None = None
+    transform: Callable[[Any], Any] | None = None
+    group_default: Any = None
+    value_default: Any = None
+
+# Famous people per sign, written to json_famous_people_by_zodiac.txt; evaluated in the
+# same pass over the signs as ZODIAC_AGGREGATIONS. The defaults match famous_people_by_zodiac():
+# a sign without a name is listed as "Unknown" and one without famousPeople counts 0.
+FAMOUS_PEOPLE_BY_SIGN = Aggregation(
+    "Famous People by Zodiac", "sum", group_by="name", value="famousPeople", transform=len,
+    group_default="Unknown", value_default=[],
+)
+
+# Aggregations written to json_zodiac_aggregations.txt
+ZODIAC_AGGREGATIONS: list[Aggregation] = [
+    Aggregation("Signs by element", "count", group_by="element"),
+    Aggregation("Signs by planet", "count", group_by="planet"),
+    Aggregation("Signs by quality", "count", group_by="qualities"),
+    Aggregation("Famous people by element", "sum", group_by="element", value="famousPeople", transform=len),
+    Aggregation("Summary length", "stats", value="summary", transform=len),
+]
+
 #####################################
 # Define Functions
 #####################################
@@ -49,8 +109,9 @@ def famous_people_by_zodiac(file_path: pathlib.Path) -> dict:
     """
     
     try:
-        with file_path.open('r', encoding='utf-8') as file:
-            zodiac_data = json.load(file)
+        # Read bytes so the fastest installed JSON parser can decode them directly
+        with file_path.open('rb') as file:
+            zodiac_data = utils_json.load(file)
             zodiac_signs = zodiac_data.get("zodiacSigns", [])
             famous_counts = {}
             for sign in zodiac_signs:
@@ -58,19 +119,259 @@ def famous_people_by_zodiac(file_path: pathlib.Path) -> dict:
                 famous_list = sign.get("famousPeople", [])
                 famous_counts[sign_name] = len(famous_list)
             return famous_counts
+    except json.JSONDecodeError as e:
+        # The JSON fetcher writes the raw download without parsing it, so this is
+        # where a truncated or malformed document is first detected.
+        logger.error(f"Invalid JSON in {file_path}: {e}")
+        return {}
     except Exception as e:
         logger.error(f"Error reading or processing JSON file: {e}")
         return {}
 
-def process_json_file():
-    """Read a JSON file, count astronauts by spacecraft, and save the result."""
+def iter_json_array_items(file_path: pathlib.Path, key: str) -> Iterator:
+    """
+    Yield the items of the array stored under a top-level key, one at a time.
+
+    The file is read in chunks and each array item is decoded on its own with
+    json.JSONDecoder.raw_decode(), so only one item (plus one chunk of text) is
+    in memory at a time instead of the whole document. Other top-level values
+    are decoded one by one and discarded.
+
+    Args:
+        file_path (pathlib.Path): Path to a JSON file whose top level is an object.
+        key (str): Top-level key holding the array, e.g. "zodiacSigns".
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed or truncated.
+    """
+    decoder = json.JSONDecoder()
+    whitespace = " \t\n\r"
+    number_chars = "0123456789+-.eE"
+
+    with file_path.open('r', encoding='utf-8') as file:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def read_more() -> None:
+            nonlocal buffer, pos, eof
+            chunk = file.read(JSON_CHUNK_CHARS)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk  # Drop text that has already been consumed
+            pos = 0
+
+        def next_char() -> str:
+            """Skip whitespace and return the next character without consuming it ('' at EOF)."""
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in whitespace:
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    return buffer[pos] if pos < len(buffer) else ""
+                read_more()
+
+        def expect(allowed: str) -> str:
+            nonlocal pos
+            char = next_char()
+            if not char or char not in allowed:
+                raise json.JSONDecodeError(f"Expected one of {allowed!r}", buffer, pos)
+            pos += 1
+            return char
+
+        def decode_value():
+            """Decode the next complete JSON value, reading more text as needed."""
+            nonlocal pos
+            next_char()
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                    # A number cut off at the end of the buffer ("12", "1.", "1e") decodes
+                    # successfully, so only accept a value once a non-number character follows it
+                    if eof or (end < len(buffer) and buffer[end] not in number_chars):
+                        pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                read_more()
+
+        expect("{")
+        if next_char() == "}":
+            return
+        while True:
+            name = decode_value()
+            expect(":")
+            if name == key:
+                expect("[")
+                if next_char() == "]":
+                    return
+                while True:
+                    yield decode_value()
+                    if expect(",]") == "]":
+                        return
+            decode_value()
+            if expect(",}") == "}":
+                return
+
+def famous_people_by_zodiac_streaming(file_path: pathlib.Path) -> dict:
+    """
+    Streaming version of famous_people_by_zodiac().
+
+    Walks the zodiacSigns array one sign at a time with iter_json_array_items(),
+    so peak memory is one sign rather than the whole document.
+    """
+    try:
+        famous_counts = {}
+        for sign in iter_json_array_items(file_path, "zodiacSigns"):
+            sign_name = sign.get("name", "Unknown")
+            famous_counts[sign_name] = len(sign.get("famousPeople", []))
+        return famous_counts
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in {file_path}: {e}")
+        return {}
+    except Exception as e:
+        logger.error(f"Error reading or processing JSON file: {e}")
+        return {}
+
+def get_path(record: Any, path: str) -> Any:
+    """Return the value at a dotted key path in nested dicts, or None if any key is missing."""
+    for key in path.split("."):
+        if not isinstance(record, dict):
+            return None
+        record = record.get(key)
+    return record
+
+def _group_key(group: Any) -> Any:
+    """Return a group value usable as a dict key; objects and lists become their JSON text."""
+    if isinstance(group, (dict, list)):
+        return json.dumps(group, sort_keys=True, default=str)
+    return group
+
+def aggregate_records(records: Iterable[dict], queries: list[Aggregation]) -> dict[str, dict]:
+    """
+    Evaluate many group-by aggregations in a single pass over the records.
+
+    Records can come from a parsed document or straight from iter_json_array_items(),
+    so the whole input never needs to be in memory. Records missing the group or value
+    path use the query's group_default / value_default, or are skipped for that query
+    when the default is None. Group values that cannot be dict keys (objects,
+    or lists inside a list) are grouped by their JSON text.
+
+    Args:
+        records (Iterable[dict]): Records to aggregate, e.g. the zodiac signs.
+        queries (list[Aggregation]): Aggregations to evaluate.
+
+    Returns:
+        dict[str, dict]: Query name -> group -> result. The group is "all" when the query
+        has no group_by. Results are ints for count, numbers for sum/min/max/mean, and
+        dicts of count/min/max/mean/stdev for stats.
+
+    Raises:
+        ValueError: If a query names an unknown aggregate function.
+    """
+    for query in queries:
+        if query.function not in AGGREGATE_FUNCTIONS:
+            raise ValueError(f"Unknown aggregate function '{query.function}' in '{query.name}'")
+
+    # Per query: group -> running count, running sum, or RunningStats
+    accumulators: list[dict] = [{} for _ in queries]
+    for record in records:
+        for query, groups in zip(queries, accumulators):
+            group_keys = get_path(record, query.group_by) if query.group_by else "all"
+            if group_keys is None:
+                group_keys = query.group_default
+            if group_keys is None:
+                continue
+            if not isinstance(group_keys, list):
+                group_keys = [group_keys]
+            group_keys = [_group_key(group) for group in group_keys]
+
+            if query.function == "count":
+                for group in group_keys:
+                    groups[group] = groups.get(group, 0) + 1
+                continue
+
+            value = get_path(record, query.value) if query.value else None
+            if value is None:
+                value = query.value_default
+            if query.transform is not None and value is not None:
+                value = query.transform(value)
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            for group in group_keys:
+                if query.function == "sum":
+                    groups[group] = groups.get(group, 0) + value
+                else:
+                    groups.setdefault(group, RunningStats()).add(value)
+
+    results: dict[str, dict] = {}
+    for query, groups in zip(queries, accumulators):
+        if query.function in ("count", "sum"):
+            results[query.name] = groups
+        elif query.function == "stats":
+            results[query.name] = {group: {"count": stats.count, **stats.as_dict()} for group, stats in groups.items()}
+        else:
+            results[query.name] = {group: getattr(stats, query.function) for group, stats in groups.items()}
+    return results
+
+def write_aggregations(output_file: pathlib.Path, results: dict[str, dict]) -> None:
+    """Write the results of aggregate_records() to a text report."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with output_file.open('w') as file:
+        for name, groups in results.items():
+            file.write(f"{name}:\n")
+            for group, result in groups.items():
+                if isinstance(result, dict):
+                    result = ", ".join(f"{key}={value:.2f}" if isinstance(value, float) else f"{key}={value}"
+                                       for key, value in result.items())
+                elif isinstance(result, float):
+                    result = f"{result:.2f}"
+                file.write(f"{group}: {result}\n")
+            file.write("\n")
+
+def process_json_file(streaming: bool = False):
+    """
+    Read a JSON file, count famous people by zodiac sign, evaluate the zodiac
+    aggregations, and save the results.
+
+    The file is parsed once: the famous-people counts are one more aggregation in
+    the same pass over the signs.
+
+    Args:
+        streaming (bool): Parse the file one zodiac sign at a time instead of loading it whole.
+            This only chooses a parser, so it is not part of the result cache key.
+    """
 
     input_file: pathlib.Path = pathlib.Path(FETCHED_DATA_DIR, "zodiac.json")
 
     output_file: pathlib.Path = pathlib.Path(PROCESSED_DIR, "json_famous_people_by_zodiac.txt")
+
+    aggregations_file: pathlib.Path = pathlib.Path(PROCESSED_DIR, "json_zodiac_aggregations.txt")
+
+    # Skip the work if the input and this script are unchanged and the outputs exist
+    cache_inputs = [input_file, pathlib.Path(__file__)]
+    cache_outputs = [output_file, aggregations_file]
+    if utils_result_cache.is_current("process_json", cache_inputs, cache_outputs):
+        return
     
-    
-    famous_counts = famous_people_by_zodiac(input_file)
+    # Evaluate the famous-people counts and all declarative aggregations in one pass over the signs
+    try:
+        if streaming:
+            zodiac_signs = iter_json_array_items(input_file, "zodiacSigns")
+        else:
+            # Read bytes so the fastest installed JSON parser can decode them directly
+            with input_file.open('rb') as file:
+                zodiac_signs = utils_json.load(file).get("zodiacSigns", [])
+        results = aggregate_records(zodiac_signs, [FAMOUS_PEOPLE_BY_SIGN, *ZODIAC_AGGREGATIONS])
+    except json.JSONDecodeError as e:
+        # The JSON fetcher writes the raw download without parsing it, so this is
+        # where a truncated or malformed document is first detected.
+        logger.error(f"Invalid JSON in {input_file}: {e}")
+        return
+    except Exception as e:
+        logger.error(f"Error reading or processing JSON file: {e}")
+        return
+    famous_counts = results.pop(FAMOUS_PEOPLE_BY_SIGN.name)
 
     # Create the output directory if it doesn't exist
     output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -81,9 +382,12 @@ def process_json_file():
         file.write("Famous People by Zodiac:\n")
         for sign, count in famous_counts.items():
             file.write(f"{sign}: {count}\n")
-    
+
+    write_aggregations(aggregations_file, results)
+    utils_result_cache.record("process_json", cache_inputs, cache_outputs)
+
     # Log the processing of the JSON file
-    logger.info(f"Processed JSON file: {input_file}, Results saved to: {output_file}")
+    logger.info(f"Processed JSON file: {input_file}, Results saved to: {output_file} and {aggregations_file}")
 
 #####################################
 # Main Execution
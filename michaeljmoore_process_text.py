@@ -5,11 +5,14 @@ Project: DataFun-03-Analytics
 
 Description:
     Process a text file to count occurrences of a specific word (e.g., "Wonka") and save the result
-    to a text file in the 'processed' folder.
+    to a text file in the 'processed' folder. A whole directory or glob of text files can also be
+    processed in parallel into one aggregate report.
 
 Usage:
     - Ensure utils_logger.py is present in the same directory.
     - Run this script directly or import its process_text_file() function.
+    - Pass --corpus with a directory or glob to count a word across many files, e.g.
+      python michaeljmoore_process_text.py --corpus "scripts/**/*.txt" --word Charlie
 
 Author: Michael J Moore
 Date: 2025-09-
@@ -24,14 +27,24 @@ Process a text file to count occurrences of the word "Romeo" and save the result
 #####################################
 
 # Import from Python Standard Library
+import argparse
+import glob
+import json
 import pathlib
+import re
 import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
 
 # Ensure project root is in sys.path for local imports
 sys.path.append(str(pathlib.Path(__file__).resolve().parent))
 
 # Import local modules
+from utils_files import AtomicWriter
 from utils_logger import logger
+import utils_result_cache
 
 #####################################
 # Declare Global Variables
@@ -41,22 +54,375 @@ from utils_logger import logger
 FETCHED_DATA_DIR: str = "data"
 PROCESSED_DIR: str = "processed"
 
+# Characters read per chunk when scanning a text file
+TEXT_CHUNK_CHARS: int = 1024 * 1024
+
+# A word is a run of letters/digits, optionally joined by apostrophes (e.g. "wonka's")
+WORD_PATTERN = re.compile(r"[^\W_]+(?:'[^\W_]+)*")
+
+# A character that can be part of a word, for word-boundary (\b) checks
+WORD_CHAR = re.compile(r"\w")
+
+# Number of most frequent words listed in the top-terms report
+TOP_TERM_COUNT: int = 25
+
+# Characters and phrases counted together by count_terms() for the term counts report
+TRACKED_TERMS: list[str] = [
+    "Wonka", "Willy Wonka", "Charlie", "Grandpa Joe", "Veruca", "Augustus",
+    "Violet", "Mike", "Slugworth", "Oompa Loompa", "golden ticket",
+]
+
+#####################################
+# Define Classes
+#####################################
+
+class CorpusFileResult(NamedTuple):
+    """Outcome of counting a word in one corpus file."""
+    file_path: pathlib.Path
+    count: int | None  # None when the file could not be read
+    seconds: float
+    error: str | None = None
+
 #####################################
 # Define Functions
 #####################################
 
+def _count_word_in_file(file_path: pathlib.Path, word: str) -> int:
+    """
+    Count the occurrences of a word in a text file (case-insensitive), raising on errors.
+
+    The file is read in fixed-size chunks, so memory use stays constant for any
+    file size. The tail of each chunk that could still be the start of a match is
+    carried into the next chunk, so matches that straddle a chunk boundary are
+    counted exactly once, and the result equals content.lower().count(word.lower()).
+    """
+    word = word.lower()
+    if not word:
+        return 0
+    pattern = re.compile(re.escape(word))
+    count = 0
+    carry = ""
+    with file_path.open('r') as file:
+        for chunk in iter(lambda: file.read(TEXT_CHUNK_CHARS), ""):
+            buffer = carry + chunk.lower()
+            last_end = 0
+            for match in pattern.finditer(buffer):
+                count += 1
+                last_end = match.end()
+            # Keep only text that is not part of a counted match and could begin one
+            carry = buffer[max(last_end, len(buffer) - len(word) + 1):]
+    return count
+
 def count_word_occurrences(file_path: pathlib.Path, word: str) -> int:
-    """Count the occurrences of a specific word in a text file (case-insensitive)."""
+    """
+    Count the occurrences of a specific word in a text file (case-insensitive).
+
+    See _count_word_in_file() for how the file is streamed.
+    """
     try:
-        with file_path.open('r') as file:
-            content: str = file.read()
-            return content.lower().count(word.lower())
+        return _count_word_in_file(file_path, word)
     except Exception as e:
         logger.error(f"Error reading text file: {e}")
         return 1
 
+def _is_word_char(char: str) -> bool:
+    return WORD_CHAR.match(char) is not None
+
+def _has_boundary(key: str, position: int) -> bool:
+    """Return True if a match of key has a word boundary at this offset inside it."""
+    if position in (0, len(key)):
+        return True  # Checked against the surrounding text by the pattern itself
+    return _is_word_char(key[position - 1]) != _is_word_char(key[position])
+
+# count_terms() scans the text once per group of terms that share a first character.
+# Each group is compiled by _term_pattern() into one trie-shaped regex that starts with
+# a literal, which keeps the regex engine's fast prefix search (one alternation of all
+# terms would lose it). A group is scanned without lookahead, so each match is the
+# longest term of the group at its position and the scan jumps past it. The other
+# occurrences that overlap a match are added back: terms that lie inside the matched
+# term (shorter prefixes, or "oompa" inside "oompa loompa") are fixed by it and added
+# from a table after the scan, and terms that start inside it and run past its end are
+# checked at those offsets only. Every occurrence of every term is therefore counted,
+# as with an Aho-Corasick automaton. Case-insensitive counts lowercase the text first,
+# because re.IGNORECASE disables the fast prefix search.
+def _term_pattern(keys: list[str], whole_word: bool) -> re.Pattern:
+    """
+    Compile terms into one regex shaped like a trie, so the engine follows a single
+    branch at each position instead of trying every term in turn. Longer terms are
+    tried before their prefixes, so each match is the longest term at its position.
+    """
+    trie: dict = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[""] = {}  # A term ends here
+
+    def branch(node: dict, depth: int) -> str:
+        options = []
+        for char, child in node.items():
+            if not char:
+                continue
+            head = re.escape(char)
+            if whole_word and depth == 0:
+                # Check the leading boundary after the first character, which keeps the
+                # engine's fast scan for characters that can start a term
+                head += r"(?<!\w.)" if _is_word_char(char) else r"(?<=\w.)"
+            options.append(head + branch(child, depth + 1))
+        if "" in node:
+            options.append(r"\b" if whole_word else "")
+        return "(?:" + "|".join(options) + ")"
+
+    return re.compile(branch(trie, 0), re.DOTALL)
+
+def count_terms(
+    file_path: pathlib.Path,
+    terms: list[str],
+    whole_word: bool = False,
+    case_insensitive: bool = True,
+) -> dict[str, int]:
+    """
+    Count many terms in a text file in a single pass over chunks of the file.
+
+    Every occurrence of every term is counted, including overlapping ones ("Wonka"
+    inside "Willy Wonka" counts for both), and memory use stays constant for any file size.
+
+    Args:
+        file_path (pathlib.Path): Path to the text file.
+        terms (list[str]): Words or phrases to count.
+        whole_word (bool): Only count matches that are not part of a longer word.
+        case_insensitive (bool): Ignore case when matching.
+
+    Returns:
+        dict[str, int]: Term -> count, in the order given. Empty dict on error.
+
+    Example:
+        count_terms(path, ["Wonka", "Charlie", "Grandpa Joe"], whole_word=True)
+    """
+    try:
+        def normalize(text: str) -> str:
+            return text.lower() if case_insensitive else text
+
+        keys = sorted({normalize(term) for term in terms if term}, key=len, reverse=True)
+        if not keys:
+            return {term: 0 for term in terms}
+        groups: dict[str, list[str]] = {}
+        for key in keys:
+            groups.setdefault(key[0], []).append(key)
+
+        # Terms of the same group found inside each term wherever it matches, including repeats
+        contained = {
+            key: [other for offset in range(len(key)) for other in groups[key[0]]
+                  if (offset, other) != (0, key) and key.startswith(other, offset)
+                  and (not whole_word or (_has_boundary(key, offset) and _has_boundary(key, offset + len(other))))]
+            for key in keys
+        }
+        # Terms of the same group that can start inside each term and run past its end,
+        # as (offset, pattern)
+        end = r"\b" if whole_word else ""
+        straddling = {
+            key: [(offset, re.compile(re.escape(other) + end)) for offset in range(1, len(key)) for other in groups[key[0]]
+                  if len(other) > len(key) - offset and other.startswith(key[offset:])
+                  and (not whole_word or _has_boundary(key, offset))]
+            for key in keys
+        }
+        scanners = [_term_pattern(group, whole_word) for group in groups.values()]
+
+        # A match that starts this far before the end of the text read so far is final:
+        # it, any term straddling it and the character after them are already in the buffer
+        margin = 2 * len(keys[0])
+
+        matched: Counter = Counter()
+        overlapping: Counter = Counter()
+
+        def scan(text: str, starts: list[int], limit: int) -> list[int]:
+            """Count matches that begin before limit; return the offset where each group resumes."""
+            resume = []
+            for pattern, start in zip(scanners, starts):
+                position = start
+                for match in pattern.finditer(text, start):
+                    if match.start() >= limit:
+                        break
+                    key = match.group()
+                    matched[key] += 1
+                    for offset, check in straddling[key]:
+                        other = check.match(text, match.start() + offset)
+                        if other:
+                            overlapping[other.group()] += 1
+                    position = match.end()
+                resume.append(max(position, limit))
+            return resume
+
+        carry = ""
+        starts = [0] * len(scanners)
+        with file_path.open('r') as file:
+            for chunk in iter(lambda: file.read(TEXT_CHUNK_CHARS), ""):
+                buffer = carry + normalize(chunk)
+                resume = scan(buffer, starts, len(buffer) - margin)
+                # Carry the unscanned tail, plus one character for the leading word-boundary check
+                base = max(min(resume) - 1, 0)
+                carry = buffer[base:]
+                starts = [position - base for position in resume]
+        scan(carry, starts, len(carry))
+
+        counts = matched + overlapping
+        for key, count in matched.items():
+            for other in contained[key]:
+                counts[other] += count
+        return {term: counts[normalize(term)] for term in terms}
+    except Exception as e:
+        logger.error(f"Error counting terms in text file: {e}")
+        return {}
+
+def build_term_index(file_path: pathlib.Path, positions: bool = False) -> dict:
+    """
+    Build a term-frequency index of every word in a text file in one pass.
+
+    The file is tokenized line by line into lowercase words, so memory grows with
+    the vocabulary, not with the file size.
+
+    Args:
+        file_path (pathlib.Path): Path to the text file.
+        positions (bool): Also record the word positions (0-based token offsets) of each term.
+
+    Returns:
+        dict: {"source", "tokens", "counts"[, "positions"]}; counts maps word -> count
+        and is ordered from most to least frequent. Empty dict on error.
+    """
+    try:
+        counts: Counter = Counter()
+        term_positions: dict[str, list[int]] = {}
+        tokens = 0
+        with file_path.open('r') as file:
+            for line in file:
+                words = WORD_PATTERN.findall(line.lower())
+                if positions:
+                    for offset, word in enumerate(words, start=tokens):
+                        term_positions.setdefault(word, []).append(offset)
+                counts.update(words)
+                tokens += len(words)
+
+        index = {"source": str(file_path), "tokens": tokens, "counts": dict(counts.most_common())}
+        if positions:
+            index["positions"] = term_positions
+        return index
+    except Exception as e:
+        logger.error(f"Error building term index: {e}")
+        return {}
+
+def save_term_index(index: dict, index_file: pathlib.Path) -> None:
+    """Write a term index to a JSON file atomically."""
+    with AtomicWriter(index_file, 'w', encoding='utf-8') as file:
+        json.dump(index, file, ensure_ascii=False)
+
+def load_term_index(index_file: pathlib.Path) -> dict:
+    """Read a term index written by save_term_index(), or return an empty dict on error."""
+    try:
+        with index_file.open('r', encoding='utf-8') as file:
+            return json.load(file)
+    except Exception as e:
+        logger.error(f"Error reading term index: {e}")
+        return {}
+
+def term_count(index: dict, word: str) -> int:
+    """Return how many times a whole word occurs, from a term index (case-insensitive)."""
+    return index.get("counts", {}).get(word.lower(), 0)
+
+def top_terms(index: dict, n: int) -> list[tuple[str, int]]:
+    """Return the n most frequent words as (word, count), from a term index."""
+    # counts is stored most-frequent first, so this is a slice, not a sort
+    return list(index.get("counts", {}).items())[:n]
+
+def _timed_word_count(file_path: pathlib.Path, word: str) -> CorpusFileResult:
+    """Worker: count a word in one file. A file that cannot be read gets count None and the error."""
+    start = time.perf_counter()
+    try:
+        count, error = _count_word_in_file(file_path, word), None
+    except Exception as e:
+        count, error = None, str(e)
+    return CorpusFileResult(file_path, count, time.perf_counter() - start, error)
+
+def find_corpus_files(source: str | pathlib.Path, pattern: str = "*.txt") -> list[pathlib.Path]:
+    """
+    Resolve a corpus source to a sorted list of files.
+
+    Args:
+        source (str | pathlib.Path): A directory (searched recursively for pattern)
+            or a glob such as "scripts/**/*.txt".
+        pattern (str): File name pattern used when source is a directory.
+
+    Returns:
+        list[pathlib.Path]: Matching files.
+    """
+    source_path = pathlib.Path(source)
+    if source_path.is_dir():
+        files = source_path.rglob(pattern)
+    else:
+        files = (pathlib.Path(name) for name in glob.iglob(str(source), recursive=True))
+    return sorted(path for path in files if path.is_file())
+
+def process_text_corpus(
+    source: str | pathlib.Path,
+    word: str = "Wonka",
+    workers: int | None = None,
+    pattern: str = "*.txt",
+) -> int:
+    """
+    Count a word across every text file in a directory or glob, in parallel.
+
+    Files are spread over a process pool and each worker streams its file.
+    Results are written to one aggregate report as they arrive, so memory stays
+    bounded however many files there are. The time taken for each file is logged.
+    Files that cannot be read are logged as errors, listed separately at the end
+    of the report and left out of the total.
+
+    Args:
+        source (str | pathlib.Path): Directory or glob of text files.
+        word (str): Word to count (case-insensitive).
+        workers (int | None): Number of worker processes (defaults to the CPU count).
+        pattern (str): File name pattern used when source is a directory.
+
+    Returns:
+        int: Total occurrences across all files that were read.
+    """
+    if workers is not None and workers < 1:
+        logger.error(f"workers must be at least 1, got {workers}. Using 1.")
+        workers = 1
+
+    files = find_corpus_files(source, pattern)
+    output_file = pathlib.Path(PROCESSED_DIR, "text_corpus_word_count.txt")
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    if not files:
+        logger.warning(f"No text files found for corpus source: {source}")
+
+    total = 0
+    counted = 0
+    failed: list[CorpusFileResult] = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor, output_file.open('w') as file:
+        file.write(f"Occurrences of '{word}' per file:\n")
+        results = executor.map(_timed_word_count, files, [word] * len(files), chunksize=16)
+        for result in results:
+            if result.count is None:
+                logger.error(f"Error reading text file {result.file_path}: {result.error}")
+                failed.append(result)
+                continue
+            logger.info(f"Counted '{word}' in {result.file_path}: {result.count} ({result.seconds:.3f}s)")
+            file.write(f"{result.file_path}: {result.count}\n")
+            total += result.count
+            counted += 1
+        file.write(f"\nTotal occurrences of '{word}' in {counted} files: {total}\n")
+        if failed:
+            file.write(f"\nFiles that could not be read ({len(failed)}):\n")
+            for result in failed:
+                file.write(f"{result.file_path}: {result.error}\n")
+
+    logger.info(f"Processed text corpus: {counted} files in {time.perf_counter() - start:.3f}s"
+                f"{f', {len(failed)} unreadable' if failed else ''}, Word count saved to: {output_file}")
+    return total
+
 def process_text_file():
-    """Read a text file, count occurrences of 'Wonka', and save the result."""
+    """Read a text file, count occurrences of 'Wonka' and of the tracked terms, index its words, and save the results."""
  
     # TODO: Replace with path to your text data file
     input_file = pathlib.Path(FETCHED_DATA_DIR, "wonkascript.txt")
@@ -64,9 +430,22 @@ def process_text_file():
     # TODO: Replace with path to your text processed file
     output_file = pathlib.Path(PROCESSED_DIR, "text_wonka_word_count.txt")
 
+    # Term index and top-terms report, written next to the word count
+    index_file = pathlib.Path(PROCESSED_DIR, "text_wonka_term_index.json")
+    top_terms_file = pathlib.Path(PROCESSED_DIR, "text_wonka_top_terms.txt")
+
+    # Table of counts for every tracked character and phrase
+    term_counts_file = pathlib.Path(PROCESSED_DIR, "text_wonka_term_counts.txt")
+
     # TODO: Replace with the word you want to count from your text file
     word_to_count: str = "Wonka"
 
+    # Skip the work if the input and this script are unchanged and the outputs exist
+    cache_inputs = [input_file, pathlib.Path(__file__)]
+    cache_outputs = [output_file, index_file, top_terms_file, term_counts_file]
+    if utils_result_cache.is_current("process_text", cache_inputs, cache_outputs, {"word": word_to_count}):
+        return
+
     # TODO: Make any necessary changes to the logic
     word_count: int = count_word_occurrences(input_file, word_to_count)
 
@@ -77,15 +456,52 @@ def process_text_file():
     with output_file.open('w') as file:
         # TODO: Update the output to describe your results
         file.write(f"Occurrences of '{word_to_count}': {word_count}\n")
+
+    # Index every word once so later queries do not need to re-read the text
+    term_index = build_term_index(input_file)
+    if term_index:
+        save_term_index(term_index, index_file)
+        with top_terms_file.open('w') as file:
+            file.write(f"Top {TOP_TERM_COUNT} words ({term_index['tokens']} words in total):\n")
+            for word, count in top_terms(term_index, TOP_TERM_COUNT):
+                file.write(f"{word}: {count}\n")
     
+    # Count all tracked terms in one pass and write them as a table
+    term_counts = count_terms(input_file, TRACKED_TERMS, whole_word=True)
+    if term_counts:
+        with term_counts_file.open('w') as file:
+            file.write("Occurrences of tracked terms (whole words, case-insensitive):\n")
+            width = max((len(term) for term in term_counts), default=0)
+            for term, count in term_counts.items():
+                file.write(f"{term:<{width}}  {count}\n")
+
+    # Only keep the result if every output was rewritten from the current input
+    if term_index and term_counts:
+        utils_result_cache.record("process_text", cache_inputs, cache_outputs, {"word": word_to_count})
+    else:
+        utils_result_cache.forget("process_text")
+
     # Log the processing of the TEXT file
-    logger.info(f"Processed text file: {input_file}, Word count saved to: {output_file}")
+    logger.info(f"Processed text file: {input_file}, Word count saved to: {output_file}, Term index saved to: {index_file}")
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command-line options for the text processor."""
+    parser = argparse.ArgumentParser(description="Count words in the Wonka script or in a corpus of text files.")
+    parser.add_argument("--corpus", metavar="SOURCE", help="directory or glob of text files to process instead of the script")
+    parser.add_argument("--word", default="Wonka", help="word to count in the corpus (case-insensitive)")
+    parser.add_argument("--pattern", default="*.txt", help="file name pattern used when SOURCE is a directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes for the corpus (default: CPU count)")
+    return parser.parse_args(argv)
 
 #####################################
 # Main Execution
 #####################################
 
 if __name__ == "__main__":
+    args = parse_args()
     logger.info("Starting text processing...")
-    process_text_file()
+    if args.corpus:
+        process_text_corpus(args.corpus, args.word, args.workers, args.pattern)
+    else:
+        process_text_file()
     logger.info("Text processing complete.")
\ No newline at end of file
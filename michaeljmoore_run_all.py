@@ -2,8 +2,15 @@
 File: michaeljmoore_run_all.py
 
 Purpose:
-    Run all data fetching ("get") scripts first, then all data processing ("process") scripts,
-    to automate the workflow for the DataFun analytics project.
+    Run all data fetching ("get") and data processing ("process") scripts to automate
+    the workflow for the DataFun analytics project. Each processor depends only on its
+    own download, so it starts as soon as that file is ready.
+
+Usage:
+    python michaeljmoore_run_all.py                     # fetch and process everything
+    python michaeljmoore_run_all.py --processing-only   # reprocess the files already in data/
+    python michaeljmoore_run_all.py --fetch-only        # download only
+    python michaeljmoore_run_all.py --no-cache          # reprocess even if the inputs are unchanged
 
 Instructions:
     - Ensure all the required scripts and their dependencies are in the same directory or in your Python path.
@@ -18,11 +25,23 @@ Date: 2025-09-12
 # Import Modules
 #####################################
 
-# Import the main() functions from each "get" script
+# Import from Python Standard Library
+import argparse
+from functools import partial
+
+# Heavy third-party packages (requests, openpyxl, pandas) are imported inside the
+# functions that use them, so importing these scripts is cheap and a processing-only
+# run never loads requests.
+
+# Import the main() functions and single-file fetchers from each "get" script
 from michaeljmoore_get_csv import main as get_csv_main
+from michaeljmoore_get_csv import fetch_csv_file, CSV_FILENAME, CSV_URL
 from michaeljmoore_get_excel import main as get_excel_main
+from michaeljmoore_get_excel import fetch_excel_file, EXCEL_FILENAME, EXCEL_URL
 from michaeljmoore_get_json import main as get_json_main
+from michaeljmoore_get_json import fetch_json_file, JSON_FILENAME, JSON_URL
 from michaeljmoore_get_text import main as get_text_main
+from michaeljmoore_get_text import fetch_txt_file, TXT_FILENAME, TXT_URL
 
 # Import the process functions from each "process" script
 from michaeljmoore_process_csv import process_csv_file
@@ -30,23 +49,130 @@ from michaeljmoore_process_excel import process_excel_file
 from michaeljmoore_process_json import process_json_file
 from michaeljmoore_process_text import process_text_file
 
+# Import the fetch and pipeline helpers
+from utils_fetch import DEFAULT_MAX_WORKERS, FetchJob, timed_fetch
+from utils_logger import configure_file_logging
+from utils_pipeline import Stage, print_pipeline_report, run_pipeline
+import utils_result_cache
+
+#####################################
+# Declare Global Variables
+#####################################
+
+FETCHED_DATA_DIR = "data"
+
+# Every download run_all() knows about; add new fetchers here
+FETCH_JOBS: list[FetchJob] = [
+    FetchJob(fetch_csv_file, FETCHED_DATA_DIR, CSV_FILENAME, CSV_URL),
+    FetchJob(fetch_excel_file, FETCHED_DATA_DIR, EXCEL_FILENAME, EXCEL_URL),
+    FetchJob(fetch_json_file, FETCHED_DATA_DIR, JSON_FILENAME, JSON_URL),
+    FetchJob(fetch_txt_file, FETCHED_DATA_DIR, TXT_FILENAME, TXT_URL),
+]
+
+# The pipeline DAG: each processor waits only for the download it reads
+FETCH_STAGES: list[Stage] = [
+    Stage("get_csv", partial(timed_fetch, FETCH_JOBS[0])),
+    Stage("get_excel", partial(timed_fetch, FETCH_JOBS[1])),
+    Stage("get_json", partial(timed_fetch, FETCH_JOBS[2])),
+    Stage("get_text", partial(timed_fetch, FETCH_JOBS[3])),
+]
+PROCESS_STAGES: list[Stage] = [
+    Stage("process_csv", process_csv_file, ("get_csv",)),
+    Stage("process_excel", process_excel_file, ("get_excel",)),
+    Stage("process_json", process_json_file, ("get_json",)),
+    Stage("process_text", process_text_file, ("get_text",)),
+]
+PIPELINE_STAGES: list[Stage] = FETCH_STAGES + PROCESS_STAGES
+
 #####################################
 # Run All Scripts
 #####################################
 
-def run_all():
-    """Run all get scripts, then all process scripts."""
-    print("=== Running all data fetching scripts ===")
-    get_csv_main()
-    get_excel_main()
-    get_json_main()
-    get_text_main()
+def select_stages(fetch: bool = True, process: bool = True) -> list[Stage]:
+    """
+    Return the pipeline stages for a run mode.
+
+    For a processing-only run the processors no longer wait for downloads and
+    read whatever is already in the data folder.
+    """
+    if fetch and process:
+        return PIPELINE_STAGES
+    if fetch:
+        return FETCH_STAGES
+    if process:
+        return [stage._replace(depends_on=()) for stage in PROCESS_STAGES]
+    return []
+
+def run_sequential(fetch: bool = True, process: bool = True):
+    """Run every get script, then every process script, one at a time."""
+    if fetch:
+        print("=== Running all data fetching scripts ===")
+        get_csv_main()
+        get_excel_main()
+        get_json_main()
+        get_text_main()
+
+    if process:
+        print("=== Running all data processing scripts ===")
+        process_csv_file()
+        process_excel_file()
+        process_json_file()
+        process_text_file()
+
+def run_all(
+    parallel: bool = True,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    fetch: bool = True,
+    process: bool = True,
+    use_cache: bool = True,
+):
+    """
+    Run all get and process scripts.
+
+    Args:
+        parallel (bool): Run the pipeline stages concurrently, starting each processor as
+            soon as its download finishes. When False, run every get script, then every
+            process script, one at a time.
+        max_workers (int): Maximum number of stages running at once in parallel mode.
+        fetch (bool): Run the get scripts.
+        process (bool): Run the process scripts.
+        use_cache (bool): Let processors keep their existing outputs when their inputs
+            have not changed since the last run.
+    """
+    utils_result_cache.set_enabled(use_cache)
+    utils_result_cache.reset_stats()
+
+    if parallel:
+        print("=== Running data pipeline ===")
+        stages = select_stages(fetch, process)
+        results = run_pipeline(stages, max_workers=max_workers)
+        print_pipeline_report(stages, results)
+    else:
+        run_sequential(fetch, process)
+
+    if process and use_cache:
+        counts = utils_result_cache.stats()
+        print(f"Result cache: {counts['hits']} hits, {counts['misses']} misses")
 
-    print("=== Running all data processing scripts ===")
-    process_csv_file()
-    process_excel_file()
-    process_json_file()
-    process_text_file()
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command-line options for run_all."""
+    parser = argparse.ArgumentParser(description="Fetch and process all DataFun data files.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--fetch-only", action="store_true", help="download the data files without processing them")
+    mode.add_argument("--processing-only", action="store_true", help="process the files already in data/ without fetching")
+    parser.add_argument("--sequential", action="store_true", help="run one script at a time instead of the parallel pipeline")
+    parser.add_argument("--no-cache", action="store_true", help="reprocess even when the inputs are unchanged")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS, help="maximum stages running at once")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
-    run_all()
\ No newline at end of file
+    args = parse_args()
+    # Write the log file from a background thread for the whole run (unless DATAFUN_LOG_ENQUEUE=0)
+    configure_file_logging()
+    run_all(
+        parallel=not args.sequential,
+        max_workers=args.workers,
+        fetch=not args.processing_only,
+        process=not args.fetch_only,
+        use_cache=not args.no_cache,
+    )
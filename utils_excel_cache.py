@@ -0,0 +1,204 @@
+"""
+Excel Cache Utilities Script
+File: utils_excel_cache.py
+
+This script provides a columnar sidecar cache for Excel workbooks.
+
+Features:
+- Converts the active sheet of a workbook once into one binary file per column,
+  stored in a folder next to the workbook (e.g. data/report.xlsx.cache/).
+- Reading a cached column loads only that column and skips openpyxl's zipped
+  XML parsing entirely.
+- The cache is keyed by the workbook's size, modification time and SHA-256.
+  When only the modification time changes (e.g. the file was re-downloaded with
+  identical content), the hash confirms the cache is still valid. Any change in
+  content rebuilds it.
+
+Columns are stored with pickle, so cell values keep their Python types
+(str, int, float, datetime). Each column file is a sequence of pickled batches
+of at most CACHE_BATCH_ROWS values, so building the cache holds one batch per
+column in memory rather than the whole sheet. Cache files are only ever read
+back from the folder this module writes.
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import json
+import pathlib
+import pickle
+import sys
+
+# Ensure project root is in sys.path for local imports
+sys.path.append(str(pathlib.Path(__file__).resolve().parent))
+
+# Import local modules
+from utils_files import file_unchanged, fingerprint, write_atomically
+from utils_logger import logger
+
+#####################################
+# Declare Global Variables
+#####################################
+
+CACHE_SUFFIX: str = ".cache"
+META_FILENAME: str = "meta.json"
+
+# Bump when the on-disk layout changes so old caches are rebuilt
+CACHE_VERSION: int = 2
+
+# Values buffered per column before they are appended to the column's file
+CACHE_BATCH_ROWS: int = 10_000
+
+#####################################
+# Define Functions
+#####################################
+
+def get_cache_dir(file_path: pathlib.Path) -> pathlib.Path:
+    """Return the sidecar cache folder for a workbook."""
+    return file_path.with_name(file_path.name + CACHE_SUFFIX)
+
+def _read_meta(cache_dir: pathlib.Path) -> dict | None:
+    """Read the cache metadata, or return None if there is no usable cache."""
+    try:
+        with cache_dir.joinpath(META_FILENAME).open('r', encoding='utf-8') as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("version") == CACHE_VERSION else None
+
+def _write_meta(cache_dir: pathlib.Path, meta: dict) -> None:
+    write_atomically(cache_dir.joinpath(META_FILENAME), json.dumps(meta, indent=4))
+
+def _column_file(cache_dir: pathlib.Path, column_letter: str) -> pathlib.Path:
+    return cache_dir.joinpath(f"{column_letter}.pickle")
+
+def _append_batch(path: pathlib.Path, values: list) -> None:
+    """Append one pickled batch of values to a column file."""
+    with path.open('ab') as file:
+        pickle.dump(values, file, pickle.HIGHEST_PROTOCOL)
+
+def build_cache(file_path: pathlib.Path) -> pathlib.Path:
+    """
+    Convert the active sheet of a workbook into per-column cache files.
+
+    The workbook is streamed once in read-only mode, and values are appended to
+    their column file every CACHE_BATCH_ROWS rows, so memory use does not grow
+    with the number of rows. The old metadata is removed first and the new one is
+    written last, so an interrupted build is never mistaken for a valid cache.
+
+    Args:
+        file_path (pathlib.Path): Path to the .xlsx file.
+
+    Returns:
+        pathlib.Path: The cache folder.
+    """
+    # Only a (re)build needs openpyxl; reading cached columns never imports it
+    import openpyxl
+    from openpyxl.utils import get_column_letter
+
+    cache_dir = get_cache_dir(file_path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir.joinpath(META_FILENAME).unlink(missing_ok=True)
+    for old_file in cache_dir.glob("*.pickle"):
+        old_file.unlink()
+    source = fingerprint(file_path)
+
+    buffers: list[list] = []  # Unflushed values, one list per column
+    letters: list[str] = []
+    row_count = 0
+    flushed_rows = 0
+
+    def flush() -> None:
+        for letter, buffer in zip(letters, buffers):
+            if buffer:
+                _append_batch(_column_file(cache_dir, letter), buffer)
+                buffer.clear()
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        sheet = workbook.active
+        sheet_title = sheet.title
+        for row in sheet.iter_rows(values_only=True):
+            # Rows can be ragged; a new, wider column starts with None for every earlier row
+            while len(buffers) < len(row):
+                letter = get_column_letter(len(buffers) + 1)
+                for start in range(0, flushed_rows, CACHE_BATCH_ROWS):
+                    _append_batch(_column_file(cache_dir, letter), [None] * min(CACHE_BATCH_ROWS, flushed_rows - start))
+                letters.append(letter)
+                buffers.append([None] * (row_count - flushed_rows))
+            for index, buffer in enumerate(buffers):
+                buffer.append(row[index] if index < len(row) else None)
+            row_count += 1
+            if row_count - flushed_rows >= CACHE_BATCH_ROWS:
+                flush()
+                flushed_rows = row_count
+        flush()
+    finally:
+        workbook.close()
+
+    _write_meta(cache_dir, {
+        "version": CACHE_VERSION,
+        "source": file_path.name,
+        **source,
+        "sheet": sheet_title,
+        "rows": row_count,
+        "columns": letters,
+    })
+    logger.info(f"Built Excel column cache for {file_path} ({row_count} rows, {len(letters)} columns)")
+    return cache_dir
+
+def ensure_cache(file_path: pathlib.Path) -> dict:
+    """
+    Make sure the cache for a workbook is current and return its metadata.
+
+    The workbook is compared with the fingerprint recorded in the metadata by
+    utils_files.file_unchanged(), so the content hash is only computed when the
+    modification time has changed.
+
+    Args:
+        file_path (pathlib.Path): Path to the .xlsx file.
+
+    Returns:
+        dict: Cache metadata (rows, columns, sheet, ...).
+    """
+    cache_dir = get_cache_dir(file_path)
+    meta = _read_meta(cache_dir)
+    if meta:
+        recorded_mtime_ns = meta["mtime_ns"]
+        if file_unchanged(file_path, meta):
+            if meta["mtime_ns"] != recorded_mtime_ns:
+                # Same content with a new timestamp: save the refreshed fast-path key
+                _write_meta(cache_dir, meta)
+            return meta
+    build_cache(file_path)
+    return _read_meta(cache_dir)
+
+def load_cached_column(file_path: pathlib.Path, column_letter: str) -> list | None:
+    """
+    Return every value in one column of the workbook's active sheet, from the cache.
+
+    Args:
+        file_path (pathlib.Path): Path to the .xlsx file.
+        column_letter (str): Column to load, e.g. "B".
+
+    Returns:
+        list | None: Cell values from top to bottom (an empty list for a column
+        past the last used one), or None if the cache could not be used.
+    """
+    try:
+        meta = ensure_cache(file_path)
+        column_letter = column_letter.upper()
+        if column_letter not in meta["columns"]:
+            return []
+        values: list = []
+        with _column_file(get_cache_dir(file_path), column_letter).open('rb') as file:
+            while True:
+                try:
+                    values.extend(pickle.load(file))
+                except EOFError:
+                    return values
+    except Exception as e:
+        logger.warning(f"Excel column cache unavailable for {file_path}: {e}")
+        return None
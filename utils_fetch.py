@@ -0,0 +1,335 @@
+"""
+Fetch Utilities Script
+File: utils_fetch.py
+
+This script provides shared helpers for the "get" scripts.
+
+Features:
+- Runs several single-file fetches concurrently with a configurable worker limit.
+- Reports how long each URL took to download.
+- Keeps a fetch manifest (ETag, Last-Modified, size, content hash) per downloaded
+  file so unchanged files can be revalidated with a conditional request instead
+  of being downloaded and rewritten.
+- Streams downloads to disk in fixed-size chunks through a temporary file that is
+  atomically renamed into place, so memory stays flat regardless of file size.
+- download_file() holds the request / 304 / write / manifest flow shared by every
+  fetch_*_file() function.
+
+The fetch_*_file() functions in each "get" script remain the single-file API.
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import hashlib
+import json
+import pathlib
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+# Ensure project root is in sys.path for local imports
+sys.path.append(str(pathlib.Path(__file__).resolve().parent))
+
+# Import local modules
+from utils_files import AtomicWriter
+from utils_logger import logger
+
+#####################################
+# Declare Global Variables
+#####################################
+
+DEFAULT_MAX_WORKERS: int = 4
+
+# Bytes requested from the network per iteration when streaming a download
+DOWNLOAD_CHUNK_SIZE: int = 64 * 1024
+
+# Name of the manifest file stored alongside the fetched data
+MANIFEST_FILENAME: str = "fetch_manifest.json"
+
+# Fetches may run on several threads; the manifest is read-modify-written under this lock
+_manifest_lock = threading.Lock()
+
+#####################################
+# Define Classes
+#####################################
+
+class FetchJob(NamedTuple):
+    """One registered download: a fetch_*_file() function and its arguments."""
+    fetch_function: Callable[[str, str, str], bool]
+    folder_name: str
+    filename: str
+    url: str
+
+#####################################
+# Define Functions
+#####################################
+
+def timed_fetch(job: FetchJob) -> float:
+    """
+    Run a single fetch job and return the elapsed wall-clock time in seconds.
+
+    Args:
+        job (FetchJob): The download to run.
+
+    Returns:
+        float: Seconds spent in the fetch function.
+
+    Raises:
+        RuntimeError: If the fetch function reports a failure, so that a pipeline
+            stage running this job fails and its dependents are skipped.
+    """
+    start = time.perf_counter()
+    succeeded = job.fetch_function(job.folder_name, job.filename, job.url)
+    elapsed = time.perf_counter() - start
+    if not succeeded:
+        raise RuntimeError(f"Fetching {job.url} failed after {elapsed:.3f}s")
+    logger.info(f"Fetched {job.url} in {elapsed:.3f}s")
+    return elapsed
+
+def fetch_all(jobs: list[FetchJob], max_workers: int = DEFAULT_MAX_WORKERS) -> dict[str, float]:
+    """
+    Run all fetch jobs in parallel on a thread pool.
+
+    Each job blocks on network I/O, so threads let the round-trips overlap
+    instead of adding up.
+
+    Args:
+        jobs (list[FetchJob]): Downloads to run.
+        max_workers (int): Maximum number of downloads in flight at once.
+
+    Returns:
+        dict[str, float]: Seconds per URL, in the order the jobs were given. Failed
+        fetches are logged and left out.
+
+    Example:
+        fetch_all([FetchJob(fetch_csv_file, "data", "data.csv", url)], max_workers=2)
+    """
+    if max_workers < 1:
+        logger.error(f"max_workers must be at least 1, got {max_workers}. Using 1.")
+        max_workers = 1
+
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(timed_fetch, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                timings[job.url] = future.result()
+            except Exception as e:
+                logger.error(f"Error fetching {job.url}: {e}")
+
+    total = time.perf_counter() - start
+    logger.info(f"Fetched {len(jobs)} files with {max_workers} workers in {total:.3f}s")
+    return {job.url: timings[job.url] for job in jobs if job.url in timings}
+
+def load_manifest(folder_name: str) -> dict:
+    """
+    Read the fetch manifest for a data folder.
+
+    Args:
+        folder_name (str): Folder that holds the fetched files and the manifest.
+
+    Returns:
+        dict: Manifest entries keyed by filename, or an empty dict if there is none.
+    """
+    manifest_path = pathlib.Path(folder_name).joinpath(MANIFEST_FILENAME)
+    try:
+        with manifest_path.open('r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (IOError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable fetch manifest {manifest_path}: {e}")
+        return {}
+
+def _save_manifest(folder_name: str, manifest: dict) -> None:
+    """Write the manifest atomically so a crash never leaves it half-written."""
+    manifest_path = pathlib.Path(folder_name).joinpath(MANIFEST_FILENAME)
+    with AtomicWriter(manifest_path, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=4, sort_keys=True)
+
+def get_manifest_entry(folder_name: str, filename: str) -> dict | None:
+    """
+    Return the manifest entry for a file if the local copy still matches it.
+
+    An entry is only trusted when the file exists on disk with the recorded size,
+    otherwise a deleted or hand-edited file would never be downloaded again.
+    """
+    entry = load_manifest(folder_name).get(filename)
+    if not entry:
+        return None
+    file_path = pathlib.Path(folder_name).joinpath(filename)
+    try:
+        if file_path.stat().st_size != entry.get("size"):
+            return None
+    except FileNotFoundError:
+        return None
+    return entry
+
+def conditional_headers(folder_name: str, filename: str) -> dict[str, str]:
+    """
+    Build If-None-Match / If-Modified-Since headers for a previously fetched file.
+
+    Args:
+        folder_name (str): Folder that holds the fetched file.
+        filename (str): Name of the fetched file.
+
+    Returns:
+        dict[str, str]: Request headers, empty when the file must be downloaded in full.
+    """
+    entry = get_manifest_entry(folder_name, filename)
+    headers: dict[str, str] = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+def known_sha256(folder_name: str, filename: str) -> str | None:
+    """Return the recorded content hash of the local file, or None if it is not trusted."""
+    entry = get_manifest_entry(folder_name, filename)
+    return entry.get("sha256") if entry else None
+
+def update_manifest(folder_name: str, filename: str, url: str, headers, sha256: str) -> None:
+    """
+    Record the validators and content hash of a successfully fetched file.
+
+    Args:
+        folder_name (str): Folder that holds the fetched file.
+        filename (str): Name of the fetched file.
+        url (str): URL the file was fetched from.
+        headers: Response headers (ETag and Last-Modified are read from them).
+        sha256 (str): SHA-256 hex digest of the downloaded content.
+    """
+    file_path = pathlib.Path(folder_name).joinpath(filename)
+    try:
+        with _manifest_lock:
+            manifest = load_manifest(folder_name)
+            manifest[filename] = {
+                "url": url,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "size": file_path.stat().st_size,
+                "sha256": sha256,
+            }
+            _save_manifest(folder_name, manifest)
+    except OSError as e:
+        logger.error(f"Error updating fetch manifest for {file_path}: {e}")
+
+def download_file(
+    folder_name: str,
+    filename: str,
+    url: str,
+    write_file: Callable[..., str | None],
+    kind: str,
+    stream: bool = True,
+    read_body: Callable[[Any], Any] | None = None,
+) -> bool:
+    """
+    Download url to folder_name/filename with a conditional request.
+
+    The request carries the ETag and Last-Modified values from the fetch manifest.
+    Nothing is written when the server answers 304 Not Modified, and write_file
+    leaves the local file untouched when the content is identical. After a
+    successful write, the manifest is updated.
+
+    Args:
+        folder_name (str): Name of the folder to save the file.
+        filename (str): Name of the output file.
+        url (str): URL to fetch.
+        write_file (Callable): The script's write_*_file(folder_name, filename, data,
+            unchanged_sha256=...) function; returns the content hash or None on error.
+        kind (str): Kind of data for log messages, e.g. "CSV".
+        stream (bool): Stream the response body instead of loading it at once.
+        read_body (Callable | None): Turns the response into the data passed to
+            write_file. Defaults to streaming the body in DOWNLOAD_CHUNK_SIZE chunks.
+
+    Returns:
+        bool: True when the local file is up to date (written or not modified),
+        False if the URL is empty, the request failed or the file could not be written.
+    """
+    if not url:
+        logger.error("The URL provided is empty. Please provide a valid URL.")
+        return False
+
+    # Imported on first use so that importing the get scripts (e.g. for a processing-only run) stays fast
+    import requests
+
+    try:
+        logger.info(f"Fetching {kind} data from {url}...")
+        with requests.get(url, headers=conditional_headers(folder_name, filename), stream=stream) as response:
+            response.raise_for_status()
+            if response.status_code == 304:
+                logger.info(f"NOT MODIFIED: {filename} is already up to date")
+                return True
+            body = read_body(response) if read_body else response.iter_content(DOWNLOAD_CHUNK_SIZE)
+            sha256 = write_file(folder_name, filename, body, unchanged_sha256=known_sha256(folder_name, filename))
+        if sha256 is None:
+            return False
+        update_manifest(folder_name, filename, url, response.headers, sha256)
+        logger.info(f"SUCCESS: {kind} file fetched and saved as {filename}")
+        return True
+    except requests.exceptions.HTTPError as http_err:
+        logger.error(f"HTTP error occurred: {http_err}")
+    except requests.exceptions.RequestException as req_err:
+        logger.error(f"Request error occurred: {req_err}")
+    return False
+
+def as_chunks(data: str | bytes | Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Normalize write_*_file() input to an iterator of byte chunks.
+
+    Strings are encoded as UTF-8, bytes are passed through whole, and any other
+    iterable (such as response.iter_content()) is streamed chunk by chunk.
+    """
+    if isinstance(data, str):
+        yield data.encode('utf-8')
+    elif isinstance(data, (bytes, bytearray)):
+        yield bytes(data)
+    else:
+        for chunk in data:
+            if chunk:
+                yield chunk
+
+def write_chunks_atomically(
+    file_path: pathlib.Path,
+    chunks: Iterable[bytes],
+    unchanged_sha256: str | None = None,
+) -> str:
+    """
+    Stream chunks into a temporary file next to file_path, then rename it into place.
+
+    Readers never see a partially written file, and only one chunk is held in
+    memory at a time. The SHA-256 of the content is computed along the way.
+
+    Args:
+        file_path (pathlib.Path): Final location of the file.
+        chunks (Iterable[bytes]): Content to write.
+        unchanged_sha256 (str | None): Hash of the current local file. When the new
+            content has the same hash, the temporary file is discarded and the
+            existing file is left untouched.
+
+    Returns:
+        str: SHA-256 hex digest of the content.
+
+    Raises:
+        IOError: If the file cannot be written; the temporary file is removed.
+    """
+    digest = hashlib.sha256()
+    writer = AtomicWriter(file_path)
+    with writer as temp_file:
+        for chunk in chunks:
+            digest.update(chunk)
+            temp_file.write(chunk)
+        sha256 = digest.hexdigest()
+        if sha256 == unchanged_sha256 and file_path.exists():
+            logger.info(f"UNCHANGED: {file_path} content matches the local copy, skipping write")
+            writer.discard()
+    return sha256
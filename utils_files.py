@@ -0,0 +1,140 @@
+"""
+File Utilities Script
+File: utils_files.py
+
+This script provides the file helpers shared by the fetch, cache and process scripts.
+
+Features:
+- file_sha256() hashes a file in fixed-size blocks, so memory stays flat.
+- AtomicWriter writes through a uniquely named temporary file next to the target
+  and renames it into place only when the with block succeeds, so readers never
+  see a partially written file. The temporary file is created with O_EXCL and
+  mode 0o666, so the process umask applies as for any newly created file.
+- write_atomically() is the one-call form for data that is already in memory.
+- fingerprint() records a file's size, modification time and SHA-256, and
+  file_unchanged() compares a file against such a record. It hashes the file only
+  when the size matches but the modification time does not.
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import hashlib
+import os
+import pathlib
+import secrets
+from typing import IO
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Bytes read per block when hashing a file
+HASH_BLOCK_SIZE: int = 1024 * 1024
+
+#####################################
+# Define Classes
+#####################################
+
+class AtomicWriter:
+    """
+    Context manager that writes a file through a temporary file renamed into place.
+
+    The target is only replaced when the with block exits normally. On an exception,
+    or after discard() was called, the temporary file is removed and any existing
+    file is left untouched.
+
+    Example:
+        with AtomicWriter(path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+    """
+
+    def __init__(self, file_path: pathlib.Path, mode: str = 'wb', encoding: str | None = None) -> None:
+        self.file_path = pathlib.Path(file_path)
+        self.mode = mode
+        self.encoding = encoding
+        self.temp_path: pathlib.Path | None = None
+        self._file: IO | None = None
+        self._discarded = False
+
+    def __enter__(self) -> IO:
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+        while True:
+            self.temp_path = self.file_path.with_name(f".{self.file_path.name}.{secrets.token_hex(8)}.part")
+            try:
+                descriptor = os.open(self.temp_path, flags, 0o666)
+                break
+            except FileExistsError:
+                continue
+        self._file = os.fdopen(descriptor, self.mode, encoding=self.encoding)
+        return self._file
+
+    def discard(self) -> None:
+        """Keep the existing file: the temporary file is removed instead of renamed."""
+        self._discarded = True
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        try:
+            self._file.close()
+            if exc_type is None and not self._discarded:
+                os.replace(self.temp_path, self.file_path)
+        finally:
+            self.temp_path.unlink(missing_ok=True)
+        return False
+
+#####################################
+# Define Functions
+#####################################
+
+def write_atomically(file_path: pathlib.Path, data: bytes | str, encoding: str = 'utf-8') -> None:
+    """Write bytes or text to file_path through a temporary file renamed into place."""
+    if isinstance(data, str):
+        data = data.encode(encoding)
+    with AtomicWriter(file_path) as file:
+        file.write(data)
+
+def file_sha256(file_path: pathlib.Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with pathlib.Path(file_path).open('rb') as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def fingerprint(file_path: pathlib.Path) -> dict:
+    """Return the size, modification time and SHA-256 of a file, for file_unchanged()."""
+    stat = pathlib.Path(file_path).stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": file_sha256(file_path)}
+
+def file_unchanged(file_path: pathlib.Path, recorded: dict) -> bool:
+    """
+    Check a file against a fingerprint() record.
+
+    The size and modification time are compared first. The content hash is only
+    computed when the size matches but the modification time differs (e.g. the file
+    was re-downloaded with identical content). In that case the recorded modification
+    time is updated in place, so the caller can save it and take the fast path next time.
+
+    Args:
+        file_path (pathlib.Path): File to check.
+        recorded (dict): Record with "size", "mtime_ns" and "sha256" keys.
+
+    Returns:
+        bool: True if the file still has the recorded content, False if it changed
+        or cannot be read.
+    """
+    try:
+        stat = pathlib.Path(file_path).stat()
+        if stat.st_size != recorded["size"]:
+            return False
+        if stat.st_mtime_ns == recorded["mtime_ns"]:
+            return True
+        if file_sha256(file_path) != recorded["sha256"]:
+            return False
+    except OSError:
+        return False
+    recorded["mtime_ns"] = stat.st_mtime_ns
+    return True
@@ -0,0 +1,125 @@
+"""
+JSON Codec Utilities Script
+File: utils_json.py
+
+This script provides one load/dump surface for JSON that uses the fastest
+installed parser.
+
+Features:
+- Uses orjson when installed, then simdjson (pysimdjson), then the standard json module.
+- Always works with bytes, which is what the fast parsers read and write natively.
+- Decode errors are always raised as json.JSONDecodeError, whichever backend is used.
+- Set the DATAFUN_JSON_BACKEND environment variable to "orjson", "simdjson" or
+  "json" to force a backend (e.g. for benchmarking). An unknown or uninstalled
+  backend is logged as a warning and the fastest installed one is used instead.
+- Indented output is always written by the standard json module, so files on disk
+  look the same whichever backend is installed (orjson only supports 2-space
+  indentation). Compact output uses the fastest backend.
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import json
+import os
+import pathlib
+import sys
+from typing import IO, Any
+
+# Import from external packages (all optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Ensure project root is in sys.path for local imports
+sys.path.append(str(pathlib.Path(__file__).resolve().parent))
+
+# Import local modules
+from utils_logger import logger
+
+#####################################
+# Declare Global Variables
+#####################################
+
+BACKENDS: tuple[str, ...] = ("orjson", "simdjson", "json")
+
+#####################################
+# Define Functions
+#####################################
+
+def available_backends() -> list[str]:
+    """Return the installed backends, fastest first."""
+    installed = {"orjson": orjson is not None, "simdjson": simdjson is not None, "json": True}
+    return [name for name in BACKENDS if installed[name]]
+
+def select_backend(name: str | None = None) -> str:
+    """
+    Choose the backend used by loads()/dumps() and return its name.
+
+    Args:
+        name (str | None): Backend to use, or None for the fastest installed one.
+
+    Raises:
+        ValueError: If the requested backend is unknown or not installed.
+    """
+    global BACKEND
+    if name is None:
+        BACKEND = available_backends()[0]
+    elif name in available_backends():
+        BACKEND = name
+    else:
+        raise ValueError(f"JSON backend '{name}' is not available; installed: {available_backends()}")
+    return BACKEND
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if BACKEND == "orjson":
+        return orjson.loads(data)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    if BACKEND == "simdjson":
+        try:
+            return simdjson.loads(data)
+        except ValueError as e:
+            raise json.JSONDecodeError(str(e), data if isinstance(data, str) else "", 0) from e
+    return json.loads(data)
+
+def load(file: IO) -> Any:
+    """Parse a JSON document from a file object (binary mode is fastest)."""
+    return loads(file.read())
+
+def dumps(obj: Any, indent: int | None = None) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes, optionally indented.
+
+    Indented output always comes from the standard json module, so the format of
+    files written with an indent does not depend on the installed backend.
+    """
+    if BACKEND == "orjson" and indent is None:
+        return orjson.dumps(obj)
+    # pysimdjson only parses, so serialization falls back to the standard library
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode('utf-8')
+
+def dump(obj: Any, file: IO[bytes], indent: int | None = None) -> None:
+    """Serialize obj as JSON to a binary file object."""
+    file.write(dumps(obj, indent=indent))
+
+#####################################
+# Select the Backend at Import
+#####################################
+
+def _select_backend_from_environment() -> str:
+    """Select the backend named by DATAFUN_JSON_BACKEND, or the fastest one if it is unusable."""
+    try:
+        return select_backend(os.environ.get("DATAFUN_JSON_BACKEND") or None)
+    except ValueError as e:
+        logger.warning(f"{e}. Ignoring DATAFUN_JSON_BACKEND.")
+        return select_backend(None)
+
+BACKEND: str = _select_backend_from_environment()
@@ -8,13 +8,24 @@ Logging is an essential way to track events and issues during execution.
 Features:
 - Logs information, warnings, and errors to a designated log file.
 - Ensures the log directory exists.
+- Setup is deferred: the log folder and file are only created when the first
+  message is written, so importing this module does no file I/O.
+- Importing this module adds a synchronous file sink and starts no threads.
+  Entry points such as michaeljmoore_run_all.py call configure_file_logging() to
+  switch to an enqueued sink: log calls put the message on a queue and a background
+  thread writes it, so logging never blocks on disk. Set the DATAFUN_LOG_ENQUEUE
+  environment variable to "0" to keep synchronous writes there too.
+- RepeatedWarning logs the first few occurrences of a warning raised inside a hot
+  loop and summarizes the rest in one "N skipped" line.
 
 THIS LOGGER SHOULD WORK WITHOUT NEEDING MODIFICATION.
 Just put a copy in your root project folder and import in your scripts as shown in the examples.
 """
 
 # Imports from Python Standard Library
+import os
 import pathlib
+from typing import Callable
 
 # Imports from external packages
 from loguru import logger
@@ -28,21 +39,108 @@ LOG_FOLDER: pathlib.Path = pathlib.Path("logs")
 # Set the name of the log file
 LOG_FILE: pathlib.Path = LOG_FOLDER.joinpath("project_log.log")
 
-# Ensure the log folder exists or create it
-try:
-    LOG_FOLDER.mkdir(exist_ok=True)
-    logger.info(f"Log folder created at: {LOG_FOLDER}")
-except Exception as e:
-    logger.error(f"Error creating log folder: {e}")
+# Let entry points write the log file from a background thread unless DATAFUN_LOG_ENQUEUE=0
+LOG_ENQUEUE: bool = os.environ.get("DATAFUN_LOG_ENQUEUE", "1") != "0"
+
+# Occurrences of a repeated warning logged individually before it is only counted
+DEFAULT_WARNING_LIMIT: int = 10
+
+_file_handler_id: int | None = None
+
+
+def configure_file_logging(enqueue: bool = LOG_ENQUEUE) -> None:
+    """
+    (Re)configure the log file sink.
 
-# Configure Loguru to write to the log file
+    With delay=True, Loguru creates the log folder and opens the file on the first
+    INFO-or-higher message instead of at import time. With enqueue=True, messages
+    are handed to a background writer thread (also safe across worker processes),
+    and any pending messages are flushed when the program exits. The enqueued sink
+    starts its writer thread as soon as it is added, so only entry points enable it.
+
+    Args:
+        enqueue (bool): Write the file asynchronously instead of on every log call.
+    """
+    global _file_handler_id
+    if _file_handler_id is not None:
+        logger.remove(_file_handler_id)
+    _file_handler_id = logger.add(LOG_FILE, level="INFO", delay=True, enqueue=enqueue)
+
+
+# Configure Loguru to write to the log file; synchronous, so importing starts no threads
 try:
-    logger.add(LOG_FILE, level="INFO")
-    logger.info(f"Logging to file: {LOG_FILE}")
+    configure_file_logging(enqueue=False)
+    logger.debug(f"Logging to file: {LOG_FILE}")
 except Exception as e:
     logger.error(f"Error configuring logger to write to file: {e}")
 
 
+class RepeatedWarning:
+    """
+    Rate limiter for a warning that can fire once per row in a hot loop.
+
+    The first `limit` occurrences are logged individually; the rest are only
+    counted, and one summary line with the total is logged at the end. Messages
+    may be passed as callables so they are only formatted when actually logged.
+
+    In worker processes, use collect=True: the first `limit` messages are kept in
+    `samples` instead of being logged, and the parent merge()s each worker's
+    instance into its own, so at most `limit` lines are logged for the whole run.
+
+    Example:
+        with RepeatedWarning("Skipped rows with an invalid Running time") as skipped:
+            for row in rows:
+                ...
+                skipped(lambda: f"Skipping invalid row: {row}")
+    """
+
+    def __init__(self, summary: str, limit: int = DEFAULT_WARNING_LIMIT, collect: bool = False) -> None:
+        self.summary = summary
+        self.limit = limit
+        self.collect = collect
+        self.count = 0
+        self.logged = 0  # Messages logged, or kept in samples when collecting
+        self.samples: list[str] = []
+
+    def _emit(self, message: str) -> None:
+        self.logged += 1
+        if self.collect:
+            self.samples.append(message)
+        else:
+            logger.opt(depth=2).warning(message)  # Attribute the line to the caller of __call__/merge
+
+    def __call__(self, message: str | Callable[[], str]) -> None:
+        """Count one occurrence and log it if the limit has not been reached."""
+        self.count += 1
+        if self.logged < self.limit:
+            self._emit(message() if callable(message) else message)
+
+    def merge(self, other: "RepeatedWarning") -> None:
+        """Add the count of an instance that collected in a worker, logging its samples up to the limit."""
+        self.count += other.count
+        for message in other.samples[:max(self.limit - self.logged, 0)]:
+            self._emit(message)
+
+    def log_summary(self, depth: int = 0) -> None:
+        """
+        Log the number of occurrences, noting how many were not logged individually.
+
+        Args:
+            depth (int): Extra stack frames to skip, so the line is attributed to the right caller.
+        """
+        if self.count == 0:
+            return
+        suppressed = self.count - self.logged
+        note = f" ({suppressed} not logged individually)" if suppressed else ""
+        logger.opt(depth=depth + 1).warning(f"{self.summary}: {self.count}{note}")
+
+    def __enter__(self) -> "RepeatedWarning":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.log_summary(depth=1)
+
+
 def get_log_file_path() -> pathlib.Path:
     """Return the path to the log file."""
     return LOG_FILE
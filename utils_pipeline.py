@@ -0,0 +1,179 @@
+"""
+Pipeline Utilities Script
+File: utils_pipeline.py
+
+This script provides a small dependency-aware scheduler for running pipeline stages.
+
+Features:
+- Each stage names the stages it depends on, forming a DAG (e.g. get_csv -> process_csv).
+- A stage starts as soon as all of its dependencies have finished, and independent
+  stages run in parallel on a thread pool.
+- If a stage raises, the stages that depend on it are skipped and the rest continue
+  (a fetch stage raises when its download fails).
+- Reports per-stage durations and the critical path (the chain of dependent stages
+  that determined the total run time).
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import pathlib
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, NamedTuple
+
+# Ensure project root is in sys.path for local imports
+sys.path.append(str(pathlib.Path(__file__).resolve().parent))
+
+# Import local modules
+from utils_logger import logger
+
+#####################################
+# Define Classes
+#####################################
+
+class Stage(NamedTuple):
+    """One pipeline step: a callable and the names of the stages it must wait for."""
+    name: str
+    function: Callable[[], object]
+    depends_on: tuple[str, ...] = ()
+
+class StageResult(NamedTuple):
+    """Outcome of one stage. Times are seconds since the pipeline started."""
+    status: str  # "ok", "failed" or "skipped"
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+#####################################
+# Define Functions
+#####################################
+
+def topological_order(stages: list[Stage]) -> list[str]:
+    """
+    Return the stage names ordered so every stage comes after its dependencies.
+
+    Raises:
+        ValueError: If a dependency is unknown or the stages contain a cycle.
+    """
+    names = {stage.name for stage in stages}
+    for stage in stages:
+        for dependency in stage.depends_on:
+            if dependency not in names:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dependency}'")
+
+    order: list[str] = []
+    remaining = {stage.name: set(stage.depends_on) for stage in stages}
+    while remaining:
+        ready = [name for name, dependencies in remaining.items() if not dependencies]
+        if not ready:
+            raise ValueError(f"Pipeline stages contain a cycle: {sorted(remaining)}")
+        for name in ready:
+            order.append(name)
+            del remaining[name]
+        for dependencies in remaining.values():
+            dependencies.difference_update(ready)
+    return order
+
+def run_pipeline(stages: list[Stage], max_workers: int = 4) -> dict[str, StageResult]:
+    """
+    Run the stages, starting each one as soon as its dependencies have finished.
+
+    Args:
+        stages (list[Stage]): Stages to run.
+        max_workers (int): Maximum number of stages running at once.
+
+    Returns:
+        dict[str, StageResult]: Result of every stage, keyed by name.
+    """
+    topological_order(stages)  # Validate before starting anything
+    if max_workers < 1:
+        logger.error(f"max_workers must be at least 1, got {max_workers}. Using 1.")
+        max_workers = 1
+    by_name = {stage.name: stage for stage in stages}
+    dependents: dict[str, list[str]] = {stage.name: [] for stage in stages}
+    waiting_on = {stage.name: len(stage.depends_on) for stage in stages}
+    for stage in stages:
+        for dependency in stage.depends_on:
+            dependents[dependency].append(stage.name)
+
+    results: dict[str, StageResult] = {}
+    pipeline_start = time.perf_counter()
+
+    def run_stage(stage: Stage) -> StageResult:
+        start = time.perf_counter() - pipeline_start
+        logger.info(f"Pipeline stage started: {stage.name}")
+        try:
+            stage.function()
+        except Exception as e:
+            logger.error(f"Pipeline stage failed: {stage.name}: {e}")
+            return StageResult("failed", start, time.perf_counter() - pipeline_start)
+        return StageResult("ok", start, time.perf_counter() - pipeline_start)
+
+    def skip_dependents(name: str) -> None:
+        now = time.perf_counter() - pipeline_start
+        for dependent in dependents[name]:
+            if dependent not in results:
+                logger.warning(f"Pipeline stage skipped: {dependent} (dependency '{name}' did not succeed)")
+                results[dependent] = StageResult("skipped", now, now)
+                skip_dependents(dependent)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {executor.submit(run_stage, stage): stage.name for stage in stages if not stage.depends_on}
+        started = set(running.values())
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+                if results[name].status != "ok":
+                    skip_dependents(name)
+                    continue
+                logger.info(f"Pipeline stage finished: {name} ({results[name].duration:.3f}s)")
+                for dependent in dependents[name]:
+                    waiting_on[dependent] -= 1
+                    if waiting_on[dependent] == 0 and dependent not in results and dependent not in started:
+                        running[executor.submit(run_stage, by_name[dependent])] = dependent
+                        started.add(dependent)
+    return results
+
+def critical_path(stages: list[Stage], results: dict[str, StageResult]) -> list[str]:
+    """
+    Return the chain of dependent stages with the longest total duration.
+
+    This is the path that bounds the pipeline's run time: speeding up any other
+    stage would not make the pipeline finish sooner.
+    """
+    by_name = {stage.name: stage for stage in stages}
+    longest: dict[str, float] = {}
+    previous: dict[str, str | None] = {}
+    for name in topological_order(stages):
+        best = max(by_name[name].depends_on, key=lambda dependency: longest[dependency], default=None)
+        longest[name] = results[name].duration + (longest[best] if best else 0.0)
+        previous[name] = best
+
+    path: list[str] = []
+    name = max(longest, key=longest.get, default=None)
+    while name is not None:
+        path.append(name)
+        name = previous[name]
+    return path[::-1]
+
+def print_pipeline_report(stages: list[Stage], results: dict[str, StageResult]) -> None:
+    """Print per-stage timings and the critical path, and log the critical path."""
+    print("=== Pipeline stages ===")
+    for stage in stages:
+        result = results[stage.name]
+        print(f"{stage.name:<16} {result.status:<8} start {result.start:7.3f}s  duration {result.duration:7.3f}s")
+
+    path = critical_path(stages, results)
+    path_time = sum(results[name].duration for name in path)
+    total = max((result.end for result in results.values()), default=0.0)
+    print(f"Critical path: {' -> '.join(path)} ({path_time:.3f}s of {total:.3f}s total)")
+    logger.info(f"Pipeline finished in {total:.3f}s, critical path: {' -> '.join(path)} ({path_time:.3f}s)")
@@ -0,0 +1,191 @@
+"""
+Result Cache Utilities Script
+File: utils_result_cache.py
+
+This script lets the process_* functions skip work when nothing they depend on has changed.
+
+Features:
+- Each processor records the fingerprint of its inputs (size, modification time and
+  SHA-256), its parameters and the output files it wrote.
+- On the next run, if the parameters match, every input is unchanged and every output
+  still exists, the processor keeps its existing output instead of recomputing it.
+- Inputs are compared by size and modification time first; the content hash is only
+  computed when those differ (e.g. a file was re-downloaded with identical content).
+- Hit and miss counts are kept for the current run and can be reported with stats().
+- A processor whose run failed part-way calls forget() instead of record(), so its
+  stale outputs are rebuilt on the next run.
+- Set the DATAFUN_RESULT_CACHE environment variable to "0" (or call set_enabled(False))
+  to always recompute.
+
+Processors list their own script as an input, so editing a processor invalidates its
+cached result. Changes to shared utils_* modules do not; disable the cache after those.
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import json
+import os
+import pathlib
+import sys
+import threading
+from collections import Counter
+from typing import Any
+
+# Ensure project root is in sys.path for local imports
+sys.path.append(str(pathlib.Path(__file__).resolve().parent))
+
+# Import local modules
+from utils_files import AtomicWriter, file_unchanged, fingerprint
+from utils_logger import logger
+
+#####################################
+# Declare Global Variables
+#####################################
+
+CACHE_FILE: pathlib.Path = pathlib.Path("processed", "result_cache.json")
+
+# Bump when the entry format changes so old entries are ignored
+CACHE_VERSION: int = 1
+
+ENABLED: bool = os.environ.get("DATAFUN_RESULT_CACHE", "1") != "0"
+
+# Processors run in parallel pipeline stages and share one cache file
+_cache_lock = threading.Lock()
+_stats: Counter = Counter()
+
+#####################################
+# Define Functions
+#####################################
+
+def set_enabled(enabled: bool) -> None:
+    """Turn the result cache on or off for this process."""
+    global ENABLED
+    ENABLED = enabled
+
+def stats() -> dict[str, int]:
+    """Return the number of cache hits and misses in this process."""
+    with _cache_lock:
+        return {"hits": _stats["hits"], "misses": _stats["misses"]}
+
+def reset_stats() -> None:
+    """Reset the hit and miss counters."""
+    with _cache_lock:
+        _stats.clear()
+
+def _load_cache() -> dict:
+    """Read the cache file, or return an empty cache if it is missing or unreadable."""
+    try:
+        with CACHE_FILE.open('r', encoding='utf-8') as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return cache if cache.get("version") == CACHE_VERSION else {}
+
+def _save_cache(cache: dict) -> None:
+    """Write the cache file atomically."""
+    with AtomicWriter(CACHE_FILE, 'w', encoding='utf-8') as file:
+        json.dump(cache, file, indent=4, sort_keys=True)
+
+def _params_key(params: dict[str, Any] | None) -> str:
+    """Return a stable string for a parameter dict."""
+    return json.dumps(params or {}, sort_keys=True, default=str)
+
+def is_current(
+    name: str,
+    inputs: list[pathlib.Path],
+    outputs: list[pathlib.Path],
+    params: dict[str, Any] | None = None,
+) -> bool:
+    """
+    Return True if a processor's recorded result is still valid and counts a hit or miss.
+
+    Args:
+        name (str): Processor name, e.g. "process_csv".
+        inputs (list[pathlib.Path]): Files the processor reads.
+        outputs (list[pathlib.Path]): Files the processor writes.
+        params (dict | None): Parameters that change the output.
+
+    Returns:
+        bool: True when the processor can keep its existing outputs.
+    """
+    if not ENABLED:
+        return False
+    with _cache_lock:
+        entry = _load_cache().get("entries", {}).get(name)
+
+    # Inputs may be hashed here, so check them outside the lock: parallel stages
+    # checking large inputs would otherwise wait for each other
+    current = (
+        entry is not None
+        and entry["params"] == _params_key(params)
+        and sorted(entry["inputs"]) == sorted(str(path) for path in inputs)
+        and all(path.exists() for path in outputs)
+    )
+    refreshed = False
+    if current:
+        recorded_mtimes = [recorded["mtime_ns"] for recorded in entry["inputs"].values()]
+        current = all(file_unchanged(path, entry["inputs"][str(path)]) for path in inputs)
+        refreshed = recorded_mtimes != [recorded["mtime_ns"] for recorded in entry["inputs"].values()]
+
+    with _cache_lock:
+        if current and refreshed:
+            # Same content with new timestamps: save the refreshed fast-path keys
+            cache = _load_cache()
+            if name in cache.get("entries", {}):
+                cache["entries"][name] = entry
+                _save_cache(cache)
+        _stats["hits" if current else "misses"] += 1
+    if current:
+        logger.info(f"UNCHANGED: inputs of {name} have not changed, keeping {', '.join(map(str, outputs))}")
+    return current
+
+def record(
+    name: str,
+    inputs: list[pathlib.Path],
+    outputs: list[pathlib.Path],
+    params: dict[str, Any] | None = None,
+) -> None:
+    """
+    Record that a processor has written its outputs from the current inputs.
+
+    Args:
+        name (str): Processor name, e.g. "process_csv".
+        inputs (list[pathlib.Path]): Files the processor read.
+        outputs (list[pathlib.Path]): Files the processor wrote.
+        params (dict | None): Parameters that change the output.
+    """
+    if not ENABLED:
+        return
+    try:
+        entry = {
+            "params": _params_key(params),
+            "inputs": {str(path): fingerprint(path) for path in inputs},
+            "outputs": [str(path) for path in outputs],
+        }
+        with _cache_lock:
+            cache = _load_cache()
+            cache["version"] = CACHE_VERSION
+            cache.setdefault("entries", {})[name] = entry
+            _save_cache(cache)
+    except OSError as e:
+        logger.error(f"Error recording result cache entry for {name}: {e}")
+
+def forget(name: str) -> None:
+    """
+    Remove a processor's entry, e.g. after a step failed and left some outputs stale.
+
+    Args:
+        name (str): Processor name, e.g. "process_csv".
+    """
+    if not ENABLED:
+        return
+    try:
+        with _cache_lock:
+            cache = _load_cache()
+            if cache.get("entries", {}).pop(name, None) is not None:
+                _save_cache(cache)
+    except OSError as e:
+        logger.error(f"Error removing result cache entry for {name}: {e}")
@@ -0,0 +1,103 @@
+"""
+Statistics Utilities Script
+File: utils_stats.py
+
+This script provides a streaming accumulator for numeric statistics.
+
+Features:
+- Computes count, min, max, mean, variance and standard deviation in a single pass.
+- Uses Welford's online algorithm, so memory use is constant and the result is
+  numerically stable even for long columns of similar values.
+- Merges accumulators built on separate chunks of data (for example in worker
+  processes) with the parallel variance combination of Chan et al.
+
+Values are added one at a time, so the data never has to be collected into a list.
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+# Import from Python Standard Library
+import math
+
+#####################################
+# Define Classes
+#####################################
+
+class RunningStats:
+    """
+    Single-pass accumulator for count, min, max, mean, variance and stdev.
+
+    Example:
+        stats = RunningStats()
+        for value in (1.0, 2.0, 4.0):
+            stats.add(value)
+        stats.as_dict()  # {"min": 1.0, "max": 4.0, "mean": 2.33..., "stdev": 1.52...}
+    """
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0  # Sum of squared differences from the current mean
+        self.min: float = math.inf
+        self.max: float = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add one value to the running statistics."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "RunningStats") -> None:
+        """
+        Fold another accumulator into this one.
+
+        The result is the same as if every value added to other had been added here.
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator), or 0 when fewer than two values were added."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation, or 0 when fewer than two values were added."""
+        return math.sqrt(self.variance)
+
+    def as_dict(self) -> dict:
+        """
+        Return the statistics in the format used by the processed stats files.
+
+        Returns:
+            dict: Keys min, max, mean and stdev, or an empty dict if no values were added.
+        """
+        if self.count == 0:
+            return {}
+        return {
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "stdev": self.stdev,
+        }